@@ -6,4 +6,10 @@ def env_bool(key, default=False):
 DEBUG_PRINT = env_bool("DEBUG_PRINT")
 PREVIEW_MODE = env_bool("PREVIEW_MODE")
 IMPORT_DRY_RUN = env_bool("IMPORT_DRY_RUN")
-REQUIRE_PARTICIPANTS_LIST = env_bool("REQUIRE_PARTICIPANTS_LIST")
\ No newline at end of file
+REQUIRE_PARTICIPANTS_LIST = env_bool("REQUIRE_PARTICIPANTS_LIST")
+# Fall back to edit-distance name matching when no lookup key matches exactly.
+IMPORT_FUZZY_NAME_MATCH = env_bool("IMPORT_FUZZY_NAME_MATCH")
+# Directory for persisted workbook extractions (JSON, pruned after a day;
+# see utils.excel.WorkbookCache).
+# Empty (the default) disables the disk cache.
+IMPORT_CACHE_DIR = os.getenv("IMPORT_CACHE_DIR", "")
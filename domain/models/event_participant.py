@@ -1,13 +1,44 @@
 # domain/models/event_participant.py (new)
 from __future__ import annotations
 
-from datetime import datetime, UTC
+from datetime import date, datetime, UTC
 from enum import StrEnum
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, ValidationError, model_validator
 
 
+def _datetime_as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _date_as_utc(value: date) -> datetime:
+    return datetime(value.year, value.month, value.day, tzinfo=UTC)
+
+
+def _string_as_utc(value: object) -> Optional[datetime]:
+    # strings (several common formats)
+    s = str(value).strip()
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(s, fmt).replace(tzinfo=UTC)
+        except Exception:
+            continue
+    try:
+        # ISO with or without time
+        return _datetime_as_utc(datetime.fromisoformat(s))
+    except Exception:
+        return None
+
+
+# Exact-type dispatch used by EventParticipant._to_datetime_utc
+_UTC_DISPATCH = {
+    datetime: _datetime_as_utc,
+    date: _date_as_utc,
+    str: _string_as_utc,
+}
+
+
 class Transport(StrEnum):
     pov = "Personal Vehicle (POV)"
     gov = "Government (Official) Vehicle (GOV)"
@@ -61,32 +92,17 @@ class EventParticipant(BaseModel):
         """Coerce date/str/Timestamp to timezone-aware datetime (UTC @ 00:00)."""
         if value is None:
             return None
+        handler = _UTC_DISPATCH.get(value.__class__)
+        if handler is not None:
+            return handler(value)
+        # pandas Timestamp and other datetime subclasses → plain datetime
         if isinstance(value, datetime):
-            return value if value.tzinfo else value.replace(tzinfo=UTC)
-        # pandas Timestamp
-        try:
-            import pandas as _pd  # local import
-            if isinstance(value, _pd.Timestamp):
-                dt = value.to_pydatetime()
-                return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
-        except Exception:
-            pass
+            to_pydatetime = getattr(value, "to_pydatetime", None)
+            return _datetime_as_utc(to_pydatetime() if to_pydatetime else value)
         # plain date
         if value.__class__.__name__ == "date":
-            return datetime(value.year, value.month, value.day, tzinfo=UTC)
-        # strings (several common formats)
-        s = str(value).strip()
-        for fmt in ("%Y-%m-%d", "%d.%m.%Y", "%m/%d/%Y"):
-            try:
-                return datetime.strptime(s, fmt).replace(tzinfo=UTC)
-            except Exception:
-                continue
-        try:
-            # ISO with or without time
-            dt = datetime.fromisoformat(s)
-            return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
-        except Exception:
-            return None
+            return _date_as_utc(value)
+        return _string_as_utc(value)
 
     @model_validator(mode="before")
     def _normalize_and_coerce_dates(cls, data: dict[str, object]):
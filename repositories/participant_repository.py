@@ -50,6 +50,11 @@ class ParticipantRepository:
         cursor = self.collection.find({"representing_country": cid})
         return [Participant.from_mongo(doc) for doc in cursor]
 
+    def find_by_countries(self, cids: List[str]) -> List[Participant]:
+        """Find participants representing any of the given country CIDs in one query."""
+        cursor = self.collection.find({"representing_country": {"$in": list(cids)}})
+        return [Participant.from_mongo(doc) for doc in cursor]
+
     def find_by_grade(self, grade: Grade) -> List[Participant]:
         """Find participants with a specific grade."""
         cursor = self.collection.find({"grade": grade.value})
@@ -35,19 +35,31 @@ Notes:
 
 # === Standard Library Imports ===
 import os
+import posixpath
 import re
 import xml.etree.ElementTree as ET
 import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Any
 
 # === Third-Party Imports ===
 import openpyxl
 import pandas as pd
-from openpyxl.utils import range_boundaries
+from openpyxl.utils import coordinate_to_tuple, range_boundaries
+from pydantic import TypeAdapter
+
+try:  # Optional libxml2-backed streaming parser for customXml parts.
+    from lxml import etree as LET  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    LET = None
 
 from config.database import mongodb
-from config.settings import DEBUG_PRINT, REQUIRE_PARTICIPANTS_LIST
+from config.settings import DEBUG_PRINT, IMPORT_FUZZY_NAME_MATCH, REQUIRE_PARTICIPANTS_LIST
 from domain.models.event import Event, EventType
 from domain.models.event_participant import DocType, EventParticipant
 from domain.models.participant import Grade, Participant
@@ -60,13 +72,15 @@ from utils.dates import MONTHS, normalize_dob, coerce_datetime, date_to_iso
 from utils.excel import WorkbookCache
 from utils.excel import _norm_tablename, get_mapping
 from utils.names import (
+    _fuzzy_key_match,
     _name_key,
     _name_key_from_raw,
+    _name_keys,
     _split_name_variants,
     _to_app_display_name,
 )
 from utils.normalize_phones import normalize_phone
-from utils.participants import _normalize_gender, lookup, initialize_cache
+from utils.participants import _normalize_gender, lookup, initialize_cache, preload as preload_participants
 from utils.translation import translate
 from utils.serialization import (
     merge_attendee_preview,
@@ -92,19 +106,65 @@ PREVIEW_PARTICIPANT_LOOKUP = True
 _DOC_TYPE_CACHE: dict[str, str] = {}
 _DOC_TYPE_SEEN: set[str] = set()
 
+# Precompiled patterns for the per-cell / per-row hot paths
+_WHITESPACE_RE = re.compile(r"\s+")
+_WORLD_SUFFIX_RE = re.compile(r",\s*world$", re.IGNORECASE)
+_CITIZENSHIP_SPLIT_RE = re.compile(r"[;,]")
+_DOC_TYPE_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_PFE_YEAR_RE = re.compile(r"PFE(\d{2})M", re.IGNORECASE)
+_MONTH_DAY_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2})")
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# (table key, normalized table key, country label) — normalized once at import
+_COUNTRY_TABLES_NORM: tuple[tuple[str, str, str], ...] = tuple(
+    (key, _norm_tablename(key), label) for key, label in COUNTRY_TABLE_MAP.items()
+)
+_COUNTRY_TABLE_KEYS_NORM = frozenset(key_norm for _, key_norm, _ in _COUNTRY_TABLES_NORM)
+_PARTICIPANTS_LISTA_KEY = _norm_tablename("ParticipantsLista")
+_PARTICIPANTS_LIST_KEY = _norm_tablename("ParticipantsList")
+# Excel headers of the (name, travel, traveling-from, grade) columns of each
+# country table, read once from the inverted matrix; key is 'tableAlb', etc.
+_COUNTRY_TABLE_FIELDS = ("name_full", "travel", "traveling_from", "grade")
+_COUNTRY_TABLE_COLS: dict[str, tuple[Optional[str], ...]] = {
+    key: tuple(
+        {t: h for h, t in get_mapping("Participants", key).items()}.get(field)
+        for field in _COUNTRY_TABLE_FIELDS
+    )
+    for key in COUNTRY_TABLE_MAP
+}
+_DEFAULT_GRADE = int(Grade.NORMAL)
+_DEFAULT_DOC_TYPE = str(DocType.id_card.value)
+
+# Key order of a spreadsheet attendee record (base fields first, as built).
+_ATTENDEE_BASE_KEYS = (
+    "name", "representing_country", "transportation", "transport_other",
+    "traveling_from", "grade",
+)
+_ATTENDEE_RECORD_TEMPLATE: dict[str, Any] = dict.fromkeys(
+    _ATTENDEE_BASE_KEYS + (
+        "position", "phone", "email", "gender", "dob", "pob", "birth_country",
+        "citizenships", "travel_doc_type", "travel_doc_number",
+        "travel_doc_issue_date", "travel_doc_expiry_date", "travel_doc_issued_by",
+        "returning_to", "diet_restrictions", "organization", "unit", "rank",
+        "intl_authority", "bio_short", "bank_name", "iban", "iban_type", "swift",
+    )
+)
+
 # ==============================================================================
 # 2. Custom XML Extraction and Parsing Utilities
 # ==============================================================================
 
+@lru_cache(maxsize=512)
 def _strip_xml_tag(tag: str) -> str:
-    """Remove namespace from an XML tag."""
-    return tag.split("}", 1)[1] if "}" in tag else tag
+    """Remove namespace from an XML tag (memoized: documents reuse few tags)."""
+    return tag.rpartition("}")[2]
 
 
 def _element_to_flat_dict(elem: ET.Element, prefix: str = "") -> Dict[str, str]:
     """
-    Recursively flatten an XML element into a key-value dict.
-    Nested elements become keys joined with underscores.
+    Flatten an XML element into a key-value dict.
+    Nested elements become keys joined with underscores; repeated keys are
+    joined with '; ' and empty leaves are skipped.
 
     Example:
         <participant>
@@ -113,24 +173,98 @@ def _element_to_flat_dict(elem: ET.Element, prefix: str = "") -> Dict[str, str]:
         </participant>
         → {"participant_name": "John", "participant_organization": "MOI"}
     """
-    children = list(elem)
-    if not children:
+    if len(elem) == 0:
         key = prefix or _strip_xml_tag(elem.tag)
         return {key: (elem.text or "").strip()}
 
-    data: Dict[str, str] = {}
-    for child in children:
-        child_tag = _strip_xml_tag(child.tag)
-        child_prefix = f"{prefix}_{child_tag}" if prefix else child_tag
-        child_data = _element_to_flat_dict(child, child_prefix)
-        for key, value in child_data.items():
-            if not value:
-                continue
-            if key in data and data[key]:
-                data[key] = f"{data[key]}; {value}"
-            else:
-                data[key] = value
-    return data
+    # Iterative pre-order walk; children are pushed reversed so leaves are
+    # visited (and repeated keys joined) in document order.
+    # Values are bucketed and joined once, so many repeated siblings stay linear.
+    buckets: Dict[str, List[str]] = {}
+    stack = [(prefix, elem)]
+    while stack:
+        node_prefix, node = stack.pop()
+        if len(node) == 0 and node is not elem:
+            value = (node.text or "").strip()
+            if value:
+                buckets.setdefault(node_prefix, []).append(value)
+            continue
+        for child in reversed(node):
+            child_tag = _strip_xml_tag(child.tag)
+            stack.append((f"{node_prefix}_{child_tag}" if node_prefix else child_tag, child))
+    return {key: "; ".join(values) for key, values in buckets.items()}
+
+
+_CUSTOM_XML_RECORD_TAGS = frozenset({"participant", "event", "participant_event"})
+_XML_PARSE_ERRORS = (ET.ParseError,) + ((LET.XMLSyntaxError,) if LET is not None else ())
+
+
+def _iter_custom_xml_part(source) -> List[tuple[str, Dict[str, str]]]:
+    """
+    Stream-parse one customXml part and return (tag, flat record) pairs for
+    every participant / event / participant_event element.
+
+    Uses lxml's iterparse when installed (comments, PIs and entity expansion
+    disabled), else ElementTree's. Finished top-level records are cleared as
+    they are flattened, so the part is never held in memory as a full tree.
+    Raises one of `_XML_PARSE_ERRORS` for malformed XML.
+
+    Pairs are returned in the order of the former reversed depth-first walk.
+    """
+    if LET is not None:
+        events = LET.iterparse(
+            source, events=("start", "end"),
+            remove_comments=True, remove_pis=True, resolve_entities=False, no_network=True,
+        )
+    else:
+        events = ET.iterparse(source, events=("start", "end"))
+
+    found: List[tuple[str, Dict[str, str]]] = []
+    open_records = 0  # matched ancestors of the current element
+    for event, elem in events:
+        tag = _strip_xml_tag(elem.tag)
+        if tag not in _CUSTOM_XML_RECORD_TAGS:
+            continue
+        if event == "start":
+            open_records += 1
+            continue
+        open_records -= 1
+        found.append((tag, _element_to_flat_dict(elem)))
+        if not open_records:  # an enclosing record still needs the subtree
+            elem.clear()
+
+    # Post-order, reversed == the pre-order, last-child-first walk used before
+    found.reverse()
+    return found
+
+
+_CUSTOM_XML_MAX_WORKERS = min(4, os.cpu_count() or 1)
+# Below this many uncompressed bytes in total, starting threads costs more
+# than parsing the parts inline (workbooks usually carry one small item1.xml).
+_CUSTOM_XML_PARALLEL_MIN_BYTES = 4 << 20
+
+
+def _parse_custom_xml_part(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> Optional[List[tuple[str, Dict[str, str]]]]:
+    """Records of one customXml part, or None if the part is malformed."""
+    try:
+        # Parse straight from the (buffered) zip stream; the
+        # decompressed part is never materialized as one bytes blob.
+        with zf.open(info) as fh:
+            return _iter_custom_xml_part(fh)
+    except _XML_PARSE_ERRORS:
+        if DEBUG_PRINT:
+            print(f"[CUSTOM-XML] Failed to parse {info.filename}")
+        return None
+
+
+def _parse_custom_xml_file_part(
+    path: str, info: zipfile.ZipInfo
+) -> Optional[List[tuple[str, Dict[str, str]]]]:
+    """`_parse_custom_xml_part` on a private handle of the archive (thread workers)."""
+    with zipfile.ZipFile(path) as zf:
+        return _parse_custom_xml_part(zf, info)
 
 
 def _collect_custom_xml_records(path: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
@@ -143,11 +277,16 @@ def _collect_custom_xml_records(path: str) -> Optional[Dict[str, List[Dict[str,
     """
     try:
         with zipfile.ZipFile(path) as zf:
-            names = [
-                n for n in zf.namelist()
-                if n.startswith("customXml/") and n.endswith(".xml")
+            # Empty parts and the itemProps*.xml datastore descriptors cannot
+            # hold records: skip them without opening
+            parts = [
+                info for info in zf.infolist()
+                if info.file_size
+                and info.filename.startswith("customXml/")
+                and info.filename.endswith(".xml")
+                and not posixpath.basename(info.filename).startswith("itemProps")
             ]
-            if not names:
+            if not parts:
                 return None
 
             collected = {
@@ -156,22 +295,22 @@ def _collect_custom_xml_records(path: str) -> Optional[Dict[str, List[Dict[str,
                 "participant_event": [],
             }
 
-            for name in names:
-                try:
-                    root = ET.fromstring(zf.read(name))
-                except ET.ParseError:
-                    if DEBUG_PRINT:
-                        print(f"[CUSTOM-XML] Failed to parse {name}")
+            if len(parts) == 1 or sum(info.file_size for info in parts) < _CUSTOM_XML_PARALLEL_MIN_BYTES:
+                results = [_parse_custom_xml_part(zf, info) for info in parts]
+            else:
+                # Several large parts: inflate and libxml2 parsing release the
+                # GIL, so parts overlap. ZipFile is not thread-safe, so each
+                # worker opens its own; map() keeps the parts in archive order.
+                with ThreadPoolExecutor(
+                    max_workers=min(len(parts), _CUSTOM_XML_MAX_WORKERS)
+                ) as pool:
+                    results = list(pool.map(lambda info: _parse_custom_xml_file_part(path, info), parts))
+
+            for part in results:
+                if part is None:
                     continue
-
-                # Depth-first traversal
-                stack = [root]
-                while stack:
-                    node = stack.pop()
-                    tag = _strip_xml_tag(node.tag)
-                    if tag in collected:
-                        collected[tag].append(_element_to_flat_dict(node))
-                    stack.extend(list(node))
+                for tag, record in part:
+                    collected[tag].append(record)
 
             if not any(collected.values()):
                 return None
@@ -212,20 +351,31 @@ def _parse_bool_value(value: object) -> Optional[bool]:
     Accept only True/False or case-insensitive Yes/No.
     Everything else returns None.
     """
-    if isinstance(value, bool):
+    cls = value.__class__
+    if cls is str:  # XML text: the common case, no str() round trip
+        return _BOOL_MAP.get(value.strip().lower())
+    if cls is bool:
         return value
-    s = _as_str_or_empty(value).lower()
-    return _BOOL_MAP.get(s)
+    return _BOOL_MAP.get(_as_str_or_empty(value).lower())
 
 
 # --- Grade --------------------------------------------------------------------
 
+_GRADE_BY_TEXT = {"0": 0, "1": 1, "2": 2}
+
 def _coerce_grade_value(value: object) -> int:
     """
     Accept only integers 0, 1, 2 (Normal=1 default).
     Any invalid or out-of-range value → 1.
     """
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    cls = value.__class__
+    if cls is str:  # custom XML text: exact digits skip the float() round trip
+        grade = _GRADE_BY_TEXT.get(value.strip())
+        if grade is not None:
+            return grade
+    elif cls is int:
+        return value if value in (0, 1, 2) else 1
+    if value is None or (isinstance(value, float) and value != value):  # NaN
         return 1
     try:
         iv = int(float(value))
@@ -239,6 +389,9 @@ def _coerce_grade_value(value: object) -> int:
 
 # --- EventType coercion -------------------------------------------------------
 
+_EVENT_TYPE_INDEX: Dict[str, EventType] = {t.value.casefold(): t for t in EventType}
+
+
 def _coerce_event_type(value: object) -> Optional[EventType]:
     """
     Coerce a raw value to EventType if possible.
@@ -248,15 +401,7 @@ def _coerce_event_type(value: object) -> Optional[EventType]:
         return None
     if isinstance(value, EventType):
         return value
-    s = _as_str_or_empty(value)
-    if not s:
-        return None
-    for variant in (s, s.title(), s.upper()):
-        try:
-            return EventType(variant)
-        except ValueError:
-            continue
-    return None
+    return _EVENT_TYPE_INDEX.get(_as_str_or_empty(value).casefold())
 
 # ==============================================================================
 # 5. Object Builders (Event, Participant, EventParticipant)
@@ -293,11 +438,18 @@ def _build_event_from_record(record: Dict[str, str]) -> Event:
     )
 
 
-def _build_participant_from_record(record: Dict[str, str]) -> Optional[Participant]:
-    """
-    Build a Participant model instance from a raw record dictionary.
-    Handles normalization of gender, grade, DOB, and boolean fields.
-    """
+def _try_build_event_from_record(record: Dict[str, str]) -> Optional[Event]:
+    """Like `_build_event_from_record`, but returns None for invalid records."""
+    try:
+        return _build_event_from_record(record)
+    except Exception as exc:
+        if DEBUG_PRINT:
+            print(f"[CUSTOM-XML] Failed to build Event: {exc}")
+        return None
+
+
+def _participant_data_from_record(record: Dict[str, str]) -> Dict[str, Any]:
+    """Normalize gender, grade, DOB, and boolean fields of a raw participant record."""
     data: Dict[str, Any] = dict(record)
 
     normalized_gender = _normalize_gender(data.get("gender"))
@@ -309,12 +461,22 @@ def _build_participant_from_record(record: Dict[str, str]) -> Optional[Participa
     if dob_dt:
         data["dob"] = dob_dt
 
-    for field in ["intl_authority"]:
-        if field in data:
-            val = _parse_bool_value(data[field])
-            if val is not None:
-                data[field] = val
+    if "intl_authority" in data:
+        val = _parse_bool_value(data["intl_authority"])
+        if val is not None:
+            data["intl_authority"] = val
+    return data
+
 
+def _build_participant_from_record(record: Dict[str, str]) -> Optional[Participant]:
+    """
+    Build a Participant model instance from a raw record dictionary.
+    Handles normalization of gender, grade, DOB, and boolean fields.
+    """
+    data = _participant_data_from_record(record)
+
+    # Keep full validation (not model_construct): it is what rejects bad
+    # XML rows and applies the name/phone/citizenship normalizers.
     try:
         return Participant.model_validate(data)
     except Exception as exc:
@@ -323,15 +485,21 @@ def _build_participant_from_record(record: Dict[str, str]) -> Optional[Participa
         return None
 
 
+def _participant_event_data_from_record(record: Dict[str, str]) -> Dict[str, Any]:
+    """Coerce the travel-document dates of a raw participant_event record."""
+    data: Dict[str, Any] = dict(record)
+    for key in ("travel_doc_issue_date", "travel_doc_expiry_date"):
+        if key in data:
+            data[key] = coerce_datetime(data.get(key), tzinfo=EU_TZ)
+    return data
+
+
 def _build_participant_event_from_record(record: Dict[str, str]) -> Optional[EventParticipant]:
     """
     Build an EventParticipant model instance from a raw record dictionary.
     Ensures date coercion for travel documents.
     """
-    data: Dict[str, Any] = dict(record)
-    for key in ("travel_doc_issue_date", "travel_doc_expiry_date"):
-        if key in data:
-            data[key] = coerce_datetime(data.get(key), tzinfo=EU_TZ)
+    data = _participant_event_data_from_record(record)
 
     try:
         return EventParticipant.model_validate(data)
@@ -341,6 +509,30 @@ def _build_participant_event_from_record(record: Dict[str, str]) -> Optional[Eve
         return None
 
 
+_PARTICIPANTS_ADAPTER = TypeAdapter(List[Participant])
+_PARTICIPANT_EVENTS_ADAPTER = TypeAdapter(List[EventParticipant])
+
+
+def _validate_batch(
+    adapter: TypeAdapter,
+    records: Iterable[Dict[str, str]],
+    to_data,
+    build_one,
+) -> list:
+    """
+    Validate a whole list of records in one pydantic-core call. If any record
+    is invalid, fall back to `build_one` per record so only the bad ones are
+    dropped (same result as building each record individually).
+    """
+    records = list(records)
+    if not records:
+        return []
+    try:
+        return adapter.validate_python([to_data(r) for r in records])
+    except Exception:
+        return [obj for obj in map(build_one, records) if obj is not None]
+
+
 # ==============================================================================
 # 6. Serialization Helpers (Preview / Merging)  (REPLACED / OPTIMIZED)
 #     (Moved to utils.serialization)
@@ -362,28 +554,20 @@ def _load_custom_xml_objects(path: str) -> Optional[Dict[str, Any]]:
     if not records:
         return None
 
-    # --- Events ---
-    events = []
-    for rec in records.get("events", []):
-        try:
-            events.append(_build_event_from_record(rec))
-        except Exception as exc:
-            if DEBUG_PRINT:
-                print(f"[CUSTOM-XML] Failed to build Event: {exc}")
-
-    # --- Participants ---
-    participants: List[Participant] = []
-    for rec in records.get("participants", []):
-        participant = _build_participant_from_record(rec)
-        if participant:
-            participants.append(participant)
-
-    # --- Participant ↔ Event relations ---
-    participant_events: List[EventParticipant] = []
-    for rec in records.get("participant_events", []):
-        ep = _build_participant_event_from_record(rec)
-        if ep:
-            participant_events.append(ep)
+    # --- Events / Participants / Participant ↔ Event relations ---
+    # Invalid records are dropped; participants and their event links are
+    # validated as one batch each, falling back per record only on a bad row.
+    events: List[Event] = [
+        ev for ev in map(_try_build_event_from_record, records.get("events", ())) if ev is not None
+    ]
+    participants: List[Participant] = _validate_batch(
+        _PARTICIPANTS_ADAPTER, records.get("participants", ()),
+        _participant_data_from_record, _build_participant_from_record,
+    )
+    participant_events: List[EventParticipant] = _validate_batch(
+        _PARTICIPANT_EVENTS_ADAPTER, records.get("participant_events", ()),
+        _participant_event_data_from_record, _build_participant_event_from_record,
+    )
 
     if not events and not participants and not participant_events:
         return None
@@ -399,7 +583,13 @@ def _load_custom_xml_objects(path: str) -> Optional[Dict[str, Any]]:
 # 8. Lookup Builders (ParticipantsLista / MAIN ONLINE)
 # ==============================================================================
 
-def _build_lookup_participantslista(df_positions: pd.DataFrame) -> Dict[str, Dict[str, str]]:
+# Shared by every name-only ParticipantsLista row, so it is a read-only view:
+# a consumer writing to one entry cannot change all of them. It still counts
+# as a hit, exactly like the per-row dict it replaces.
+_EMPTY_POSITION_ENTRY: Mapping[str, str] = MappingProxyType({"position": "", "phone": "", "email": ""})
+
+
+def _build_lookup_participantslista(df_positions: pd.DataFrame) -> Dict[str, Mapping[str, str]]:
     """
     Build lookup from the 'ParticipantsLista' sheet.
 
@@ -412,29 +602,112 @@ def _build_lookup_participantslista(df_positions: pd.DataFrame) -> Dict[str, Dic
             "email": ...
         }
     """
-    name_col  = next((c for c in df_positions.columns if "name (" in c.lower()), None)
-    pos_col   = next((c for c in df_positions.columns if "position" in c.lower()), None)
-    phone_col = next((c for c in df_positions.columns if "phone" in c.lower()), None)
-    email_col = next((c for c in df_positions.columns if "email" in c.lower()), None)
+    cols = _norm_cols(df_positions.columns)
+    name_col  = _find_col(cols, "name (")
+    pos_col   = _find_col(cols, "position")
+    phone_col = _find_col(cols, "phone")
+    email_col = _find_col(cols, "email")
 
-    look: Dict[str, Dict[str, str]] = {}
+    look: Dict[str, Mapping[str, str]] = {}
     if not name_col:
         return look
 
-    for _, row in df_positions.iterrows():
-        raw = _normalize(str(row.get(name_col, "")))
+    # Columns are converted once; missing position/email columns read as ''.
+    n = len(df_positions)
+    names  = _normalized_str(_column(df_positions, name_col))
+    poss   = _normalized_str(_column(df_positions, pos_col)) if pos_col else [""] * n
+    emails = _normalized_str(_column(df_positions, email_col)) if email_col else [""] * n
+    phones = _column(df_positions, phone_col).tolist() if phone_col else None
+
+    for i, raw in enumerate(names):
         key = _name_key_from_raw(raw)
         if not key:
             continue
-        phone_value = normalize_phone(row.get(phone_col, "")) if phone_col else None
+        phone_value = normalize_phone(phones[i]) if phones is not None else None
+        if not (poss[i] or phone_value or emails[i]):
+            look[key] = _EMPTY_POSITION_ENTRY  # name-only row: share one instance
+            continue
         look[key] = {
-            "position": _normalize(str(row.get(pos_col, ""))) if pos_col else "",
+            "position": poss[i],
             "phone":    phone_value or "",
-            "email":    _normalize(str(row.get(email_col, ""))) if email_col else "",
+            "email":    emails[i],
         }
     return look
 
 
+def _combine_lookups(
+    online_lookup: Dict[str, Dict[str, object]],
+    positions_lookup: Dict[str, Dict[str, str]],
+) -> Dict[str, tuple[Optional[dict], Optional[dict]]]:
+    """Union both name-keyed lookups into key → (MAIN ONLINE, ParticipantsLista)."""
+    return {
+        k: (online_lookup.get(k), positions_lookup.get(k))
+        for k in online_lookup.keys() | positions_lookup.keys()
+    }
+
+
+def _variant_key(first: str, middle: str, last: str) -> str:
+    """Lookup key of one `_split_name_variants` split (parts are already canonical)."""
+    return f"{last}|{first} {middle}".strip() if middle else f"{last}|{first}".strip()
+
+
+def _match_name_lookups(
+    raw_name: str,
+    combined: Dict[str, tuple[Optional[dict], Optional[dict]]],
+) -> tuple[dict, dict, tuple[str, ...]]:
+    """
+    Probe the combined lookup with every surname split of `raw_name`.
+    Returns (MAIN ONLINE entry, ParticipantsLista entry, keys probed for them)
+    of the first split that hits either table; ({}, {}, ()) when nothing matches.
+    """
+    if not combined:  # workbook without MAIN ONLINE / ParticipantsLista rows
+        return {}, {}, ()
+    # Variant parts are already canonical (_split_name_variants runs _canon),
+    # so keys are assembled directly instead of re-canonicalizing via _name_key.
+    for f, m, l in _split_name_variants(raw_name):
+        key_a = _variant_key(f, m, l)
+        keys: tuple[str, ...] = (key_a,)
+        cand_list, cand_comp = combined.get(key_a, (None, None))
+        # 'LAST|First' fallback only differs from key_a when a middle name exists
+        if m and f and not (cand_list and cand_comp):
+            key_b = f"{l}|{f}".strip()
+            alt_list, alt_comp = combined.get(key_b, (None, None))
+            if alt_list or alt_comp:
+                keys += (key_b,)
+            cand_list = cand_list or alt_list
+            cand_comp = cand_comp or alt_comp
+        if cand_list or cand_comp:
+            return cand_list or {}, cand_comp or {}, keys
+    return {}, {}, ()
+
+
+def _fuzzy_name_matches(
+    misses: Iterable[str],
+    combined: Dict[str, tuple[Optional[dict], Optional[dict]]],
+    claimed: set,
+) -> Dict[str, str]:
+    """
+    Map each raw name without an exact hit to the closest lookup key (typos,
+    dropped diacritics in one of the sheets), see `_fuzzy_key_match`.
+
+    Keys another attendee matched exactly (`claimed`) are never offered, and
+    a key reached by more than one name is ambiguous and dropped, so a fuzzy
+    hit cannot hand one person's DOB / passport / bank data to another.
+    """
+    free = [key for key in combined if key not in claimed]
+    if not free:
+        return {}
+    hits: Dict[str, str] = {}
+    for raw_name in misses:
+        for f, m, l in _split_name_variants(raw_name):
+            hit = _fuzzy_key_match(_variant_key(f, m, l), free)
+            if hit:
+                hits[raw_name] = hit
+                break
+    reached = Counter(hits.values())
+    return {raw_name: key for raw_name, key in hits.items() if reached[key] == 1}
+
+
 def _build_lookup_main_online(df_online: pd.DataFrame) -> Dict[str, Dict[str, object]]:
     """
     Build lookup from the 'MAIN ONLINE → ParticipantsList' table.
@@ -444,96 +717,136 @@ def _build_lookup_main_online(df_online: pd.DataFrame) -> Dict[str, Dict[str, ob
     Value:
         normalized field dictionary with translated and enriched values.
     """
-    cols = {c.lower().strip(): c for c in df_online.columns}
-
-    def col(label: str) -> Optional[str]:
-        return cols.get(label.lower())
+    cols = _norm_cols(df_online.columns)
+    # header → position of its first occurrence, so each label costs one probe
+    positions = {c: i for i, c in reversed(list(enumerate(df_online.columns)))}
+    n = len(df_online)
+
+    # Every column is resolved and converted once; the row loop below only
+    # indexes plain lists. Missing columns read as '' (or None for raw cells).
+    def series(label: str) -> Optional[pd.Series]:
+        c = cols.get(label.casefold())
+        return df_online.iloc[:, positions[c]] if c is not None else None
+
+    def text(label: str) -> List[str]:
+        s = series(label)
+        return _normalized_str(s) if s is not None else [""] * n
+
+    def strings(label: str) -> List[str]:
+        s = series(label)
+        return _str_values(s).tolist() if s is not None else [""] * n
+
+    def stripped(label: str) -> List[str]:
+        s = series(label)
+        return _str_values(s).str.strip().tolist() if s is not None else [""] * n
+
+    def raw(label: str, default: object = None) -> List[object]:
+        s = series(label)
+        return s.tolist() if s is not None else [default] * n
+
+    def name_text(label: str) -> List[str]:
+        s = series(label)
+        if s is None:
+            return [""] * n
+        return _normalized_str(s.where(s.astype(bool), ""))  # falsy cells → ''
+
+    firsts, middles, lasts = name_text("Name"), name_text("Middle name"), name_text("Last name")
+    rows = [i for i in range(n) if firsts[i] or lasts[i]]
+    if not rows:
+        return {}
+    if len(rows) < n:  # convert the remaining columns for named rows only
+        df_online = df_online.iloc[rows]
+        firsts, middles, lasts = ([column[i] for i in rows] for column in (firsts, middles, lasts))
+        n = len(rows)
+
+    genders = stripped("Gender")
+    # The suffix pattern needs a comma; skip the regex for the usual plain names
+    birth_countries = [
+        _WORLD_SUFFIX_RE.sub("", c) if "," in c else c for c in text("Country of Birth")
+    ]
+    citizenships = strings("Citizenship(s)")
+    doc_types = raw("Traveling document type", "")
+    transportations = stripped("Transportation")
+    transport_others = stripped("Transportation (Other)")
+    iban_types = stripped("IBAN Type")
+    phones = raw("Phone number", "")
+    dobs = raw("Date of Birth (DOB)")
+    pobs = text("Place Of Birth (POB)")
+    emails = text("Email address")
+    doc_numbers = text("Traveling document number")
+    doc_issues = raw("Traveling document issuance date")
+    doc_expiries = raw("Traveling document expiration date")
+    doc_issued_by = text("Traveling document issued by")
+    traveling_from = text("Traveling from")
+    returning_to = text("Returning to")
+    diets = text("Diet restrictions")
+    organizations = text("Organization")
+    units = text("Unit")
+    ranks = text("Rank")
+    authorities = text("Authority")
+    bios = text("Short professional biography")
+    bank_names = text("Bank name")
+    ibans = text("IBAN")
+    swifts = text("SWIFT")
+
+    # translate() is a network round trip: call it once per distinct string
+    translated = _translate_many(
+        (value for column in (doc_issued_by, organizations, units, ranks, bios) for value in column),
+        "en",
+    )
+    # Genders and citizenship lists repeat heavily: resolve each distinct cell once
+    gender_by_raw = {
+        raw_gender: (g.value if (g := _normalize_gender(raw_gender)) else raw_gender)
+        for raw_gender in set(genders)
+    }
+    citizenships_by_raw = {
+        raw_cit: tuple(c for c in map(_normalize, _CITIZENSHIP_SPLIT_RE.split(raw_cit)) if c)
+        for raw_cit in set(citizenships)
+    }
 
     look: Dict[str, Dict[str, object]] = {}
-    for _, row in df_online.iterrows():
-        first  = _normalize(str(row.get(col("Name")) or ""))
-        middle = _normalize(str(row.get(col("Middle name")) or ""))
-        last   = _normalize(str(row.get(col("Last name")) or ""))
-
-        if not first and not last:
-            continue
+    for i in range(n):
+        first, middle, last = firsts[i], middles[i], lasts[i]
 
         first_middle = " ".join(part for part in [first, middle] if part).strip()
-        key  = _name_key(last, first_middle)
-        keys = [key]
         if middle and first:
-            keys.append(_name_key(last, first))  # Fallback
-
-        # --- Gender normalization ---
-        gender_col = col("Gender")
-        gender_raw = (str(row.get(gender_col, "")) if gender_col else "").strip()
-        normalized_gender = _normalize_gender(gender_raw)
-        gender = normalized_gender.value if normalized_gender else gender_raw
-
-        # --- Birth country translation ---
-        birth_country_raw  = re.sub(r",\s*world$", "", _normalize(str(row.get(col("Country of Birth"), ""))), flags=re.IGNORECASE)
-
-        # --- Travel document type ---
-        travel_doc_type_col = col("Traveling document type")
-
-        travel_doc_type_raw = _collect_doc_type(
-            row.get(travel_doc_type_col, "") if travel_doc_type_col else ""
-        )
-        # --- Transport and banking fields ---
-        transportation_col     = col("Transportation")
-        transport_other_col    = col("Transportation (Other)")
-        iban_type_col          = col("IBAN Type")
-
-        transportation_value   = str(row.get(transportation_col, "")) if transportation_col else ""
-        transport_other_value  = str(row.get(transport_other_col, "")) if transport_other_col else ""
-        iban_type_value        = str(row.get(iban_type_col, "")) if iban_type_col else ""
-
-        # --- Compose normalized entry ---
-        phone_col = col("Phone number")
-        phone_raw = row.get(phone_col, "") if phone_col else ""
-        phone_list_value = normalize_phone(phone_raw) or ""
+            keys = _name_keys(last, first_middle, first)  # plus 'LAST|First' fallback
+        else:
+            keys = _name_keys(last, first_middle)
 
         entry = {
             "name": _to_app_display_name(" ".join([first, middle, last]).strip()),
-            "gender": gender,
-            "dob": row.get(col("Date of Birth (DOB)")),
-            "pob": _normalize(str(row.get(col("Place Of Birth (POB)"), ""))),
-            "birth_country": birth_country_raw,
-            "citizenships": [
-                _normalize(x)
-                for x in re.split(r"[;,]", str(row.get(col("Citizenship(s)"), "")))
-                if _normalize(x)
-            ],
-            "email_list": _normalize(str(row.get(col("Email address"), ""))),
-            "phone_list": phone_list_value,
-            "travel_doc_type": travel_doc_type_raw,
-            "travel_doc_number": _normalize(str(row.get(col("Traveling document number"), ""))),
-            "travel_doc_issue": row.get(col("Traveling document issuance date")),
-            "travel_doc_expiry": row.get(col("Traveling document expiration date")),
-            "travel_doc_issued_by": translate(
-                _normalize(str(row.get(col("Traveling document issued by"), ""))), "en"
-            ),
-            "transportation_declared": transportation_value.strip(),
-            "transport_other": transport_other_value.strip(),
-            "traveling_from_declared": _normalize(str(row.get(col("Traveling from"), ""))),
-            "returning_to": _normalize(str(row.get(col("Returning to"), ""))),
-            "diet_restrictions": _normalize(str(row.get(col("Diet restrictions"), ""))),
-            "organization": translate(_normalize(str(row.get(col("Organization"), ""))), "en"),
-            "unit": translate(_normalize(str(row.get(col("Unit"), ""))), "en"),
-            "rank": translate(_normalize(str(row.get(col("Rank"), ""))), "en"),
-            "intl_authority": _normalize(str(row.get(col("Authority"), ""))),
-            "bio_short": translate(_normalize(str(row.get(col("Short professional biography"), ""))), "en"),
-            "bank_name": _normalize(str(row.get(col("Bank name"), ""))),
-            "iban": _normalize(str(row.get(col("IBAN"), ""))),
-            "iban_type": iban_type_value.strip(),
-            "swift": _normalize(str(row.get(col("SWIFT"), ""))),
+            "gender": gender_by_raw[genders[i]],
+            "dob": dobs[i],
+            "pob": pobs[i],
+            "birth_country": birth_countries[i],
+            "citizenships": list(citizenships_by_raw[citizenships[i]]),
+            "email_list": emails[i],
+            "phone_list": normalize_phone(phones[i]) or "",
+            "travel_doc_type": _collect_doc_type(doc_types[i]),
+            "travel_doc_number": doc_numbers[i],
+            "travel_doc_issue": doc_issues[i],
+            "travel_doc_expiry": doc_expiries[i],
+            "travel_doc_issued_by": translated[doc_issued_by[i]],
+            "transportation_declared": transportations[i],
+            "transport_other": transport_others[i],
+            "traveling_from_declared": traveling_from[i],
+            "returning_to": returning_to[i],
+            "diet_restrictions": diets[i],
+            "organization": translated[organizations[i]],
+            "unit": translated[units[i]],
+            "rank": translated[ranks[i]],
+            "intl_authority": authorities[i],
+            "bio_short": translated[bios[i]],
+            "bank_name": bank_names[i],
+            "iban": ibans[i],
+            "iban_type": iban_types[i],
+            "swift": swifts[i],
         }
 
         for nk in keys:
-            if not nk:
-                continue
-            if nk not in look:
-                look[nk] = entry
+            if nk:
+                look.setdefault(nk, entry)  # first row wins
 
     return look
 
@@ -568,12 +881,18 @@ def parse_for_commit(path: str, *, preview_only: bool = True) -> dict:
         participant_events: List[EventParticipant] = custom_bundle.get("participant_events", [])
 
         participants_by_id = {p.pid: p for p in participants}
+
+        # Single pass over the relations: merge attendees and serialize each
+        # referenced participant once, even when it attends several events.
+        participant_previews: Dict[str, Dict[str, Any]] = {}
         attendees = []
         for ep in participant_events:
             participant = participants_by_id.get(ep.participant_id)
             if not participant:
                 continue
             attendees.append(merge_attendee_preview(participant, ep))
+            if participant.pid not in participant_previews:
+                participant_previews[participant.pid] = serialize_participant(participant)
 
         payload = {
             "event": event_obj.model_dump() if event_obj else {},
@@ -581,7 +900,10 @@ def parse_for_commit(path: str, *, preview_only: bool = True) -> dict:
             "objects": custom_bundle,
             "preview": {
                 "event": serialize_event(event_obj),
-                "participants": [serialize_participant(p) for p in participants],
+                "participants": [
+                    participant_previews.pop(p.pid, None) or serialize_participant(p)
+                    for p in participants
+                ],
                 "participant_events": [serialize_participant_event(ep) for ep in participant_events],
             },
         }
@@ -595,241 +917,260 @@ def parse_for_commit(path: str, *, preview_only: bool = True) -> dict:
     cache = WorkbookCache(path)
     participant_lookup_enabled = not preview_only or PREVIEW_PARTICIPANT_LOOKUP
 
+    try:
+        # ----------------------------------------------------------------------
+        # 1. Event Header
+        # ----------------------------------------------------------------------
+        eid, title, start_date, end_date, place, country, cost = _read_event_header_block(path, cache)
+        if DEBUG_PRINT:
+            print(
+                "[STEP] Event header:",
+                {"eid": eid, "title": title, "start_date": start_date,
+                 "end_date": end_date, "place": place, "country": country, "cost": cost},
+            )
 
-    # --------------------------------------------------------------------------
-    # 1. Event Header
-    # --------------------------------------------------------------------------
-    eid, title, start_date, end_date, place, country, cost = _read_event_header_block(path, cache)
-    if DEBUG_PRINT:
-        print(
-            "[STEP] Event header:",
-            {"eid": eid, "title": title, "start_date": start_date,
-             "end_date": end_date, "place": place, "country": country, "cost": cost},
-        )
-
-    # --------------------------------------------------------------------------
-    # 2. Table Discovery & Lookups
-    # --------------------------------------------------------------------------
-    tables = list_tables(path)
-    idx = _index_tables(tables)
-
-    plist = _find_table_exact(idx, "ParticipantsLista")
-    ponl = _find_table_exact(idx, "ParticipantsList")
-
-    if not plist:
-        raise RuntimeError("Required table 'ParticipantsLista' not found")
-    if REQUIRE_PARTICIPANTS_LIST and not ponl:
-        raise RuntimeError("Required table 'ParticipantsList' (MAIN ONLINE) not found")
-
-    df_positions = _read_table_df(path, plist, cache)
-    df_online = _read_table_df(path, ponl, cache) if ponl else pd.DataFrame()
+        # ----------------------------------------------------------------------
+        # 2. Table Discovery & Lookups
+        # ----------------------------------------------------------------------
+        tables = cache.get_tables()
+        idx = _index_tables(tables)
 
-    positions_lookup = _build_lookup_participantslista(df_positions)
-    online_lookup = _build_lookup_main_online(df_online) if not df_online.empty else {}
+        plist = _find_table_norm(idx, _PARTICIPANTS_LISTA_KEY)
+        ponl = _find_table_norm(idx, _PARTICIPANTS_LIST_KEY)
 
-    _finalize_doc_type_cache()
+        if not plist:
+            raise RuntimeError("Required table 'ParticipantsLista' not found")
+        if REQUIRE_PARTICIPANTS_LIST and not ponl:
+            raise RuntimeError("Required table 'ParticipantsList' (MAIN ONLINE) not found")
 
-    if DEBUG_PRINT:
-        print(f"[STEP] Positions lookup entries: {len(positions_lookup)}")
-        print(f"[STEP] Online lookup entries: {len(online_lookup)}")
+        df_positions = _read_table_df(path, plist, cache)
+        df_online = _read_table_df(path, ponl, cache) if ponl else pd.DataFrame()
 
-    # --------------------------------------------------------------------------
-    # 3. Collect Attendees from Country Tables
-    # --------------------------------------------------------------------------
-    attendees: List[dict] = []
-    initial_attendees: List[dict] = []
+        positions_lookup = _build_lookup_participantslista(df_positions)
+        online_lookup = _build_lookup_main_online(df_online) if not df_online.empty else {}
 
-    for key, country_label in COUNTRY_TABLE_MAP.items():
-        table = _find_table_exact(idx, key)
-        if not table:
-            continue
+        _finalize_doc_type_cache()
 
-        df = _read_table_df(path, table, cache)
-        if df.empty:
-            continue
-
-        # Use the Excel matrix to resolve headers for this country table
-        # Matrix shape: {excel_header -> target_field}
-        m = get_mapping("Participants", key)  # key is 'tableAlb', 'tableBih', etc.
-
-        # Invert once to target->excel_header for quick lookups
-        inv = {t: h for h, t in m.items()}
-
-        # Pick headers from the inverted map. Return None if missing (we'll guard later).
-        nm_col = inv.get("name_full")  # was "Name and Last Name"
-        trans_col = inv.get("travel")  # was "Travel"
-        from_col = inv.get("traveling_from")  # was "Traveling from"
-        grade_col = inv.get("grade")  # was "Grade (0 - BL, 1 - Pass, 2 - Excel)"
-
-        # Defensive: if the workbook renamed a header unexpectedly, drop to None.
-        if nm_col not in df.columns:
-            nm_col = None
-        if trans_col not in df.columns:
-            trans_col = None
-        if from_col not in df.columns:
-            from_col = None
-        if grade_col not in df.columns:
-            grade_col = None
-
-        if not nm_col:
-            continue
-
-        prefer_online_transport = trans_col is None
-
-        for _, row in df.iterrows():
-            name_cell = row.get(nm_col)
-            if name_cell is None or pd.isna(name_cell):
+        if DEBUG_PRINT:
+            print(f"[STEP] Positions lookup entries: {len(positions_lookup)}")
+            print(f"[STEP] Online lookup entries: {len(online_lookup)}")
+
+        # One probe per name key serves both tables.
+        combined_lookup = _combine_lookups(online_lookup, positions_lookup)
+
+        # ----------------------------------------------------------------------
+        # 3. Collect Attendees from Country Tables
+        # ----------------------------------------------------------------------
+        attendees: List[dict] = []
+        initial_attendees: List[dict] = []  # only populated when DEBUG_PRINT is on
+
+        name_matches: Dict[str, tuple[dict, dict, tuple[str, ...]]] = {}
+        # Citizenship lists repeat across attendees (same few countries)
+        citizenship_matches: Dict[tuple, tuple[list, list[str]]] = {}
+
+        country_tables = [
+            (key, table, country_label)
+            for key, key_norm, country_label in _COUNTRY_TABLES_NORM
+            if (table := _find_table_norm(idx, key_norm))
+        ]
+        # Country CIDs are resolved once per table, and with lookups enabled all
+        # of their participants are fetched in one query up front, so the
+        # per-attendee lookup() calls below never go to the database.
+        country_cids = {
+            label: get_country_cid_by_name(label) or label for _key, _table, label in country_tables
+        }
+        if participant_lookup_enabled:
+            preload_participants(country_cids.values())
+
+        # Every table is read and exact-matched before any record is built, so
+        # the (opt-in) fuzzy fallback only sees keys no attendee matched exactly.
+        table_rows: List[tuple[str, str, bool, list]] = []
+        for key, table, country_label in country_tables:
+            df = _read_table_df(path, table, cache)
+            if df.empty:
                 continue
 
-            if isinstance(name_cell, str) and not name_cell.strip():
-                continue
+            # Headers resolved at import; any the workbook renamed drop to None.
+            present = set(df.columns)
+            nm_col, trans_col, from_col, grade_col = (
+                col if col in present else None for col in _COUNTRY_TABLE_COLS[key]
+            )
 
-            raw_name = _normalize(str(name_cell))
-            if not raw_name or raw_name.upper() == "TOTAL":
+            if not nm_col:
                 continue
 
-            def _normalized_cell(col_name: Optional[str]) -> str:
-                if not col_name:
-                    return ""
-                value = row.get(col_name)
-                if value is None or (isinstance(value, float) and pd.isna(value)):
-                    return ""
-                return _normalize(str(value))
-
-            transportation = _normalized_cell(trans_col)
-            traveling_from = _normalized_cell(from_col)
-            grade_val = row.get(grade_col, None)
-            grade = None
-            if isinstance(grade_val, (int, float)) and not pd.isna(grade_val):
-                try:
-                    grade = int(grade_val)
-                except Exception:
-                    pass
-
-            # --- Match lookups ---
-            variants = list(_split_name_variants(raw_name))
-            p_list, p_comp = {}, {}
-            for f, m, l in variants:
-                key_a = _name_key(l, " ".join([f, m]).strip())
-                key_b = _name_key(l, f) if f else None
-                cand_list = (online_lookup.get(key_a) or (online_lookup.get(key_b) if key_b else None)) or {}
-                cand_comp = (positions_lookup.get(key_a) or (positions_lookup.get(key_b) if key_b else None)) or {}
-                if cand_list or cand_comp:
-                    p_list, p_comp = cand_list, cand_comp
-                    break
-
-            # --- Base attendee record ---
-            ordered = _normalize(raw_name)
-            if "," in ordered:
-                last_part, first_part = [x.strip() for x in ordered.split(",", 1)]
-                ordered = f"{first_part} {last_part}".strip()
-            base_name = _to_app_display_name(ordered)
-
-            country_cid = get_country_cid_by_name(country_label) or country_label
-            if transportation:
-                transportation_value = transportation
-            elif prefer_online_transport:
-                transportation_value = p_list.get("transportation_declared") or ""
-            else:
-                transportation_value = ""
-            transport_other_value = (str(p_list.get("transport_other", "")) or "").strip()
-            traveling_from_value = traveling_from or p_list.get("traveling_from_declared") or ""
-            grade_value = grade if grade is not None else int(Grade.NORMAL)
-
-            base_record = {
-                "name": base_name,
-                "representing_country": country_cid,
-                "transportation": transportation_value,
-                "transport_other": transport_other_value,
-                "traveling_from": traveling_from_value,
-                "grade": grade_value,
-            }
-            initial_attendees.append(base_record)
-
-            # --- Enrich with ParticipantsLista info ---
-            record = {
-                **base_record,
-                "position": p_comp.get("position") or "",
-                "phone": normalize_phone(p_comp.get("phone")) or "",
-                "email": p_comp.get("email") or "",
-            }
-
-            # --- MAIN ONLINE enrichment ---
-            online = p_list or {}
-            _fill_if_missing(record, "position", online, "position_online")
-            _fill_if_missing(record, "phone", online, "phone_list")
-            _fill_if_missing(record, "email", online, "email_list")
-            _fill_if_missing(record, "traveling_from", online, "traveling_from_declared")
-            if not record.get("transportation") and prefer_online_transport:
-                record["transportation"] = online.get("transportation_declared") or None
-            _fill_if_missing(record, "transport_other", online, "transport_other")
-
-            # --- Country & citizenship normalization ---
-            birth_country_value = online.get("birth_country", "")
-            birth_res = resolve_country_flexible(str(birth_country_value))
-            birth_country_cid = birth_res["cid"] if birth_res else country_cid
-            citizenships_raw = online.get("citizenships", [])
-            if isinstance(citizenships_raw, str):
-                citizenships_raw = [citizenships_raw]
-
-            citizenships_clean: list[str] = []
-            for tok in _split_multi_country(citizenships_raw):
-                res = resolve_country_flexible(tok)
-                if res and res.get("cid"):
-                    cid = res["cid"]
-                    if cid not in citizenships_clean:
-                        citizenships_clean.append(cid)
-
-            if DEBUG_PRINT:
-                print("[TOKENS]", _split_multi_country(online.get("citizenships", [])))
-            for tok in _split_multi_country(online.get("citizenships", [])):
-                r = resolve_country_flexible(tok)
-                print("   ->", tok, "=>", (r and r.get("cid"), r and r.get("country")))
-            if DEBUG_PRINT:
-                print("[OUT] citizenships:", citizenships_clean)
-
-            raw_doc = online.get("travel_doc_type_raw", "")
-            # --- Final enrichment ---
-            record.update({
-                "gender": online.get("gender", ""),
-                "dob": date_to_iso(online.get("dob"), tzinfo=EU_TZ),
-                "pob": online.get("pob", ""),
-                "birth_country": birth_country_cid,
-                "citizenships": citizenships_clean,
-                "travel_doc_type": _DOC_TYPE_CACHE.get(raw_doc, str(DocType.id_card.value)),
-                "travel_doc_number": online.get("travel_doc_number", ""),
-                "travel_doc_issue_date": date_to_iso(online.get("travel_doc_issue"), tzinfo=EU_TZ),
-                "travel_doc_expiry_date": date_to_iso(online.get("travel_doc_expiry"), tzinfo=EU_TZ),
-                "travel_doc_issued_by": online.get("travel_doc_issued_by", ""),
-                "returning_to": online.get("returning_to", ""),
-                "diet_restrictions": online.get("diet_restrictions", ""),
-                "organization": online.get("organization", ""),
-                "unit": online.get("unit", ""),
-                "rank": online.get("rank", ""),
-                "intl_authority": _parse_bool_value(online.get("intl_authority", "")) or False,
-                "bio_short": online.get("bio_short", ""),
-                "bank_name": online.get("bank_name", ""),
-                "iban": online.get("iban", ""),
-                "iban_type": online.get("iban_type"),
-                "swift": online.get("swift", ""),
-            })
-            if DEBUG_PRINT:
-                print(f"[DEBUG] citizenships_in={online.get('citizenships')} → {record['citizenships']}")
-
-            participant = None
-            if participant_lookup_enabled:
-                participant = lookup(
-                    name_display=record.get("name", ""),
-                    country_name=country_label,
-                    dob_source=online.get("dob"),
-                    representing_country=country_cid,
-                )
-
-            if participant:
-                record["pid"] = participant.pid
+            prefer_online_transport = trans_col is None
+
+            # Blank / 'TOTAL' name rows are dropped with vectorized string ops;
+            # the loop then zips only the columns it reads (plain Python scalars,
+            # no per-row Series like iterrows()).
+            names = _normalized_text(df[nm_col])
+            keep = names.ne("") & names.str.upper().ne("TOTAL")
+            kept = df.loc[keep]
+            kept_names = names[keep]
+            # 'Last, First' → 'First Last' for the whole column in two str calls
+            parts = kept_names.str.split(",", n=1, expand=True)
+            ordered_names = kept_names
+            if parts.shape[1] == 2:
+                swapped = (parts[1].str.strip() + " " + parts[0].str.strip()).str.strip()
+                ordered_names = kept_names.where(parts[1].isna(), swapped)
+            blank_col = repeat("")
+            rows = list(zip(
+                kept_names,
+                ordered_names,
+                _normalized_text(kept[trans_col]) if trans_col else blank_col,
+                _normalized_text(kept[from_col]) if from_col else blank_col,
+                kept[grade_col] if grade_col else repeat(None),
+            ))
+            # Memoized: a name can repeat across tables
+            for raw_name in kept_names:
+                if raw_name not in name_matches:
+                    name_matches[raw_name] = _match_name_lookups(raw_name, combined_lookup)
+            table_rows.append(
+                (country_label, country_cids[country_label], prefer_online_transport, rows)
+            )
 
-            record["phone"] = normalize_phone(record.get("phone")) or ""
-            attendees.append(record)
+        fuzzy_hits: Dict[str, str] = {}
+        if IMPORT_FUZZY_NAME_MATCH:
+            claimed = {k for _list, _comp, keys in name_matches.values() for k in keys}
+            misses = [raw for raw, (_list, _comp, keys) in name_matches.items() if not keys]
+            fuzzy_hits = _fuzzy_name_matches(misses, combined_lookup, claimed)
+
+        for country_label, country_cid, prefer_online_transport, rows in table_rows:
+            for raw_name, ordered, transportation, traveling_from, grade_val in rows:
+                grade = None
+                if isinstance(grade_val, (int, float)) and grade_val == grade_val:  # not NaN
+                    try:
+                        grade = int(grade_val)
+                    except Exception:
+                        pass
+
+                # --- Matched lookup entries ---
+                fuzzy_key = fuzzy_hits.get(raw_name)
+                if fuzzy_key:
+                    p_list, p_comp = (entry or {} for entry in combined_lookup[fuzzy_key])
+                else:
+                    p_list, p_comp, _keys = name_matches[raw_name]
+
+                # --- Base attendee record ---
+                base_name = _to_app_display_name(ordered)
+
+                if transportation:
+                    transportation_value = transportation
+                elif prefer_online_transport:
+                    transportation_value = p_list.get("transportation_declared") or ""
+                else:
+                    transportation_value = ""
+                # MAIN ONLINE entries hold stripped text already (see the lookup builder)
+                transport_other_value = p_list.get("transport_other", "")
+                traveling_from_value = traveling_from or p_list.get("traveling_from_declared") or ""
+                grade_value = grade if grade is not None else _DEFAULT_GRADE
+
+                # Presized copy of the full record shape: no dict growth or
+                # temporary update() dicts while the fields are filled in.
+                record = _ATTENDEE_RECORD_TEMPLATE.copy()
+                record["name"] = base_name
+                record["representing_country"] = country_cid
+                record["transportation"] = transportation_value
+                record["transport_other"] = transport_other_value
+                record["traveling_from"] = traveling_from_value
+                record["grade"] = grade_value
+                if DEBUG_PRINT:
+                    initial_attendees.append({k: record[k] for k in _ATTENDEE_BASE_KEYS})
+
+                # --- Enrich with ParticipantsLista info ---
+                record["position"] = p_comp.get("position") or ""
+                record["phone"] = normalize_phone(p_comp.get("phone")) or ""
+                record["email"] = p_comp.get("email") or ""
+
+                # --- MAIN ONLINE enrichment ---
+                online = p_list or {}
+                _fill_if_missing(record, "position", online, "position_online")
+                _fill_if_missing(record, "phone", online, "phone_list")
+                _fill_if_missing(record, "email", online, "email_list")
+                _fill_if_missing(record, "traveling_from", online, "traveling_from_declared")
+                if not record.get("transportation") and prefer_online_transport:
+                    record["transportation"] = online.get("transportation_declared") or None
+                _fill_if_missing(record, "transport_other", online, "transport_other")
+
+                # --- Country & citizenship normalization ---
+                birth_country_value = online.get("birth_country", "")
+                birth_res = resolve_country_flexible(str(birth_country_value))
+                birth_country_cid = birth_res["cid"] if birth_res else country_cid
+                citizenships_raw = online.get("citizenships", [])
+                if isinstance(citizenships_raw, str):
+                    citizenships_raw = [citizenships_raw]
+
+                citizenship_key = tuple(citizenships_raw)
+                cached_citizenships = citizenship_matches.get(citizenship_key)
+                if cached_citizenships is None:
+                    resolved_tokens = [
+                        (tok, resolve_country_flexible(tok))
+                        for tok in _split_multi_country(citizenships_raw)
+                    ]
+                    unique_cids: list[str] = []
+                    seen_cids: set[str] = set()
+                    for _tok, res in resolved_tokens:
+                        cid = res.get("cid") if res else None
+                        if cid and cid not in seen_cids:
+                            seen_cids.add(cid)
+                            unique_cids.append(cid)
+                    cached_citizenships = citizenship_matches[citizenship_key] = (
+                        resolved_tokens, unique_cids
+                    )
+                resolved_tokens, unique_cids = cached_citizenships
+                citizenships_clean = list(unique_cids)  # records must not share a list
+
+                if DEBUG_PRINT:
+                    print("[TOKENS]", [tok for tok, _res in resolved_tokens])
+                    for tok, r in resolved_tokens:
+                        print("   ->", tok, "=>", (r and r.get("cid"), r and r.get("country")))
+                    print("[OUT] citizenships:", citizenships_clean)
+                    print(f"[DEBUG] citizenships_in={online.get('citizenships')} → {citizenships_clean}")
+
+                raw_doc = online.get("travel_doc_type_raw", "")
+                # --- Final enrichment ---
+                record["gender"] = online.get("gender", "")
+                record["dob"] = date_to_iso(online.get("dob"), tzinfo=EU_TZ)
+                record["pob"] = online.get("pob", "")
+                record["birth_country"] = birth_country_cid
+                record["citizenships"] = citizenships_clean
+                record["travel_doc_type"] = _DOC_TYPE_CACHE.get(raw_doc, _DEFAULT_DOC_TYPE)
+                record["travel_doc_number"] = online.get("travel_doc_number", "")
+                record["travel_doc_issue_date"] = date_to_iso(online.get("travel_doc_issue"), tzinfo=EU_TZ)
+                record["travel_doc_expiry_date"] = date_to_iso(online.get("travel_doc_expiry"), tzinfo=EU_TZ)
+                record["travel_doc_issued_by"] = online.get("travel_doc_issued_by", "")
+                record["returning_to"] = online.get("returning_to", "")
+                record["diet_restrictions"] = online.get("diet_restrictions", "")
+                record["organization"] = online.get("organization", "")
+                record["unit"] = online.get("unit", "")
+                record["rank"] = online.get("rank", "")
+                record["intl_authority"] = _parse_bool_value(online.get("intl_authority", "")) or False
+                record["bio_short"] = online.get("bio_short", "")
+                record["bank_name"] = online.get("bank_name", "")
+                record["iban"] = online.get("iban", "")
+                record["iban_type"] = online.get("iban_type")
+                record["swift"] = online.get("swift", "")
+
+                participant = None
+                if participant_lookup_enabled:
+                    participant = lookup(
+                        name_display=record.get("name", ""),
+                        country_name=country_label,
+                        dob_source=online.get("dob"),
+                        representing_country=country_cid,
+                    )
+
+                if participant:
+                    record["pid"] = participant.pid
+
+                record["phone"] = normalize_phone(record.get("phone")) or ""
+                if fuzzy_key:
+                    # Details come from a near-miss name: surface it for review
+                    record["fuzzy_name_match"] = fuzzy_key
+                attendees.append(record)
+    finally:
+        cache.clear()
 
     # --------------------------------------------------------------------------
     # 4. Assemble Final Payload
@@ -879,7 +1220,33 @@ def parse_for_commit(path: str, *, preview_only: bool = True) -> dict:
 
 def _normalize(s: Optional[str]) -> str:
     """Normalize whitespace and coerce None to an empty string."""
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # split() drops the same (Unicode) whitespace as `\s+` + strip(), in C
+    return " ".join((s or "").split())
+
+def _normalized_text(column: pd.Series) -> pd.Series:
+    """Whitespace-normalized text of every cell in a column; missing cells become ''."""
+    text = column.astype("string").str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+    return text.fillna("")
+
+
+def _str_values(column: pd.Series) -> pd.Series:
+    """`str(cell)` for every cell, exactly as a per-row str() would render it."""
+    return column.astype(object).astype(str)
+
+
+def _normalized_str(column: pd.Series) -> List[str]:
+    """Vectorized `_normalize(str(cell))` for a whole column."""
+    return _str_values(column).str.replace(_WHITESPACE_RE, " ", regex=True).str.strip().tolist()
+
+
+def _translate_many(texts: Iterable[str], output_lang: str) -> Dict[str, str]:
+    """Translate each distinct text once; returns text → translation."""
+    out: Dict[str, str] = {}
+    for text in texts:
+        if text not in out:
+            out[text] = translate(text, output_lang)
+    return out
+
 
 def _collect_doc_type(value: object) -> str:
     """Collect raw travel document values without normalizing yet."""
@@ -894,7 +1261,7 @@ def _collect_doc_type(value: object) -> str:
 def _finalize_doc_type_cache() -> None:
     """Normalize all collected document types exactly once."""
     for raw in _DOC_TYPE_SEEN:
-        key = re.sub(r"[^a-z0-9]+", " ", raw.lower()).strip()
+        key = _DOC_TYPE_NON_ALNUM_RE.sub(" ", raw.lower()).strip()
 
         # Passport detection
         if "pass" in key:
@@ -917,10 +1284,31 @@ def _index_tables(tables: List[TableRef]) -> Dict[str, List[TableRef]]:
     return idx
 
 
-def _find_table_exact(idx: Dict[str, List[TableRef]], desired: str) -> Optional[TableRef]:
-    """Find the first table matching `desired` by normalized name."""
-    target = _norm_tablename(desired)
-    group = idx.get(target)
+def _norm_cols(columns: Iterable[Any]) -> Dict[str, str]:
+    """
+    Map normalized (case-folded, stripped) header → original column name, in
+    column order; when headers repeat, the first occurrence wins.
+    Built once per table so column finders never re-lower headers.
+    """
+    cols: Dict[str, str] = {}
+    for c in columns:
+        cols.setdefault(str(c).casefold().strip(), c)
+    return cols
+
+
+def _find_col(cols: Dict[str, str], needle: str) -> Optional[str]:
+    """Resolve a column from a `_norm_cols` map: the first header containing `needle`."""
+    return next((orig for norm, orig in cols.items() if needle in norm), None)
+
+
+def _column(df: pd.DataFrame, col: Optional[str]) -> Optional[pd.Series]:
+    """The first column named `col` (headers may repeat), or None if not given."""
+    return df.iloc[:, list(df.columns).index(col)] if col is not None else None
+
+
+def _find_table_norm(idx: Dict[str, List[TableRef]], key_norm: str) -> Optional[TableRef]:
+    """Find the first table for an already-normalized key (single dict probe)."""
+    group = idx.get(key_norm)
     return group[0] if group else None
 
 
@@ -929,38 +1317,164 @@ def _read_table_df(path: str, table: TableRef, cache: WorkbookCache | None = Non
     Read a ListObject range (e.g. 'A4:K7') into a DataFrame.
     Uses the header row as columns.
     """
-    def _build_df(ws) -> pd.DataFrame:
-        min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-        rows = list(
-            ws.iter_rows(
-                min_row=min_row,
-                max_row=max_row,
-                min_col=min_col,
-                max_col=max_col,
-                values_only=True,
-            )
+    if cache:
+        return cache.get_table_df(
+            table, lambda: _dataframe_from_rows(_read_table_values(path, table, cache))
         )
-        return _dataframe_from_rows(rows)
+    return _dataframe_from_rows(_read_table_values(path, table))
+
 
+def _read_table_rows(
+    path: str,
+    table: TableRef,
+    cache: WorkbookCache | None = None,
+) -> tuple[List[str], List[tuple]]:
+    """
+    Read a ListObject range as (header, data rows) without building a DataFrame.
+    Rows without any non-blank cell are dropped.
+    """
+    raw = _read_table_values(path, table, cache)
+    if not raw:
+        return [], []
+    return _header_from_row(raw[0]), [r for r in raw[1:] if _has_value(r)]
+
+
+def _read_table_values(
+    path: str,
+    table: TableRef,
+    cache: WorkbookCache | None = None,
+) -> List[tuple]:
+    """
+    Raw cell values of a table range, header row included.
+    Whole sheets are bulk-read through python-calamine when it is installed;
+    openpyxl is the fallback.
+    """
     if cache:
-        return cache.get_table_df(table, _build_df)
+        return cache.get_table_values(table, lambda: _read_sheet_range(cache, table))
+
+    with WorkbookCache(path, cache_dir="") as one_off:
+        return _read_sheet_range(one_off, table)
+
+
+def _read_sheet_range(cache: WorkbookCache, table: TableRef) -> List[tuple]:
+    """Read a table range via the cache's calamine sheet values, else openpyxl."""
+    sheet_values = cache.get_sheet_values(table.sheet_title)
+    if sheet_values is not None:
+        return _slice_range(sheet_values, table.ref)
+    return _read_range(cache.get_sheet(table.sheet_title), table.ref)
+
+
+def _read_range(ws, ref: str) -> List[tuple]:
+    """Return the cell values of an 'A1:K7' style range, row by row."""
+    min_col, min_row, max_col, max_row = _range_bounds(ref)
+    return list(
+        ws.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+            values_only=True,
+        )
+    )
+
+
+def _slice_range(sheet_values: List[List[Any]], ref: str) -> List[tuple]:
+    """Cut an 'A1:K7' style range out of full-sheet values, padding with None."""
+    min_col, min_row, max_col, max_row = _range_bounds(ref)
+    width = max_col - min_col + 1
+    out: List[tuple] = []
+    for r in range(min_row - 1, max_row):
+        row = sheet_values[r] if r < len(sheet_values) else []
+        cells = row[min_col - 1:max_col]
+        if len(cells) < width:
+            cells = cells + [None] * (width - len(cells))
+        out.append(tuple(cells))
+    return out
+
+
+@lru_cache(maxsize=128)
+def _range_bounds(ref: str) -> tuple[int, int, int, int]:
+    """Memoized `range_boundaries` — table refs repeat across passes and uploads."""
+    return range_boundaries(ref)
+
+
+def _has_value(row: tuple) -> bool:
+    """True if any cell holds a value other than None or a blank string."""
+    return any(v is not None and (not isinstance(v, str) or v.strip()) for v in row)
+
+
+def _header_from_row(row: tuple) -> List[str]:
+    """Normalize a table header row into column labels ('' for blank cells)."""
+    return [_normalize(str(h)) if h is not None else "" for h in row]
+
+
+class _MissingSheetError(RuntimeError):
+    """A required worksheet is absent from the workbook."""
+
+    def __init__(self, title: str):
+        super().__init__(f"Sheet '{title}' not found")
+        self.title = title
+
+
+def _sheet_cell_values(wb, title: str, *coords: str) -> tuple:
+    """`_cell_values` on sheet `title`; raises if the sheet does not exist."""
+    if title not in wb.sheetnames:
+        raise _MissingSheetError(title)
+    return _cell_values(wb[title], *coords)
+
+
+def _read_header_cells(cache: WorkbookCache) -> tuple:
+    """Participants!A1, Participants!A2 and COST Overview!B15 through the cache."""
+    a1, a2 = cache.get_cells(
+        "Participants", ("A1", "A2"),
+        lambda: _sheet_cell_values(cache.get_workbook(), "Participants", "A1", "A2"),
+    )
+    (b15,) = cache.get_cells(
+        "COST Overview", ("B15",),
+        lambda: _sheet_cell_values(cache.get_workbook(), "COST Overview", "B15"),
+    )
+    return a1, a2, b15
+
 
-    wb = openpyxl.load_workbook(path, data_only=True)
-    ws = wb[table.sheet_title]
-    return _build_df(ws)
+def _cell_values(ws, *coords: str) -> tuple:
+    """
+    Read single cells (e.g. 'A1', 'A2') with one bounded `iter_rows` pass over
+    their bounding box. Random `ws["A1"]` access rescans the sheet in
+    read-only mode and instantiates a Cell per lookup.
+    """
+    points = [coordinate_to_tuple(coord) for coord in coords]
+    min_row = min(r for r, _ in points)
+    min_col = min(c for _, c in points)
+    block = list(
+        ws.iter_rows(
+            min_row=min_row,
+            max_row=max(r for r, _ in points),
+            min_col=min_col,
+            max_col=max(c for _, c in points),
+            values_only=True,
+        )
+    )
+    values = []
+    for row, col in points:
+        r, c = row - min_row, col - min_col
+        values.append(block[r][c] if r < len(block) and c < len(block[r]) else None)
+    return tuple(values)
 
 
 def _dataframe_from_rows(rows: List[tuple]) -> pd.DataFrame:
     if not rows:
         return pd.DataFrame()
-    header = [_normalize(str(h)) if h is not None else "" for h in rows[0]]
-    df = pd.DataFrame(rows[1:], columns=header).dropna(how="all")
+    header = _header_from_row(rows[0])
+    # Drop blank rows (typically trailing styled-range rows) before pandas sees them
+    data = [r for r in rows[1:] if _has_value(r)]
 
-    empty_cols = [col for col in df.columns if not str(col).strip()]
-    if empty_cols:
-        df = df.drop(columns=empty_cols)
+    # Columns with an empty header are dropped from the rows, not from the frame
+    keep = [i for i, h in enumerate(header) if h.strip()]
+    if len(keep) < len(header):
+        header = [header[i] for i in keep]
+        data = [tuple(r[i] for i in keep) for r in data]
 
-    return df
+    return pd.DataFrame.from_records(data, columns=header, coerce_float=False)
 
 
 # ==============================================================================
@@ -969,7 +1483,7 @@ def _dataframe_from_rows(rows: List[tuple]) -> pd.DataFrame:
 
 def _filename_year_from_eid(filename: str) -> int:
     """Infer 4-digit year from file name pattern like 'PFE25M2' → 2025."""
-    m = re.search(r"PFE(\d{2})M", filename.upper())
+    m = _PFE_YEAR_RE.search(filename)
     return 2000 + int(m.group(1)) if m else datetime.now(UTC).year
 
 
@@ -990,12 +1504,12 @@ def _parse_event_header(a1: str, a2: str, year: int):
 
     if len(parts) >= 3:
         month_and_start, end_day_str, location = parts[0], parts[1], parts[2]
-        m = re.match(r"([A-Z]+)\s+(\d{1,2})", month_and_start.upper())
+        m = _MONTH_DAY_RE.match(month_and_start)
         if m:
-            month_num = MONTHS.get(m.group(1))
+            month_num = MONTHS.get(m.group(1).upper())
             start_day = int(m.group(2))
             if month_num:
-                end_day = int(re.sub(r"\D", "", end_day_str))
+                end_day = int(_NON_DIGIT_RE.sub("", end_day_str))
                 start_date = datetime(year, month_num, start_day, tzinfo=UTC)
                 end_date = datetime(year, month_num, end_day, tzinfo=UTC)
 
@@ -1018,20 +1532,16 @@ def _read_event_header_block(
     cache: WorkbookCache | None = None,
 ) -> tuple[str, str, datetime, datetime, str, Optional[str], Optional[float]]:
     """Read event header data from the Participants and COST Overview sheets."""
-    wb = cache.get_workbook() if cache else openpyxl.load_workbook(path, data_only=True)
-    if "Participants" not in wb.sheetnames:
-        raise RuntimeError("Sheet 'Participants' not found")
-    if "COST Overview" not in wb.sheetnames:
-        raise RuntimeError("Sheet 'COST Overview' not found")
-
-    ws = wb["Participants"]
-    a1 = ws["A1"].value or ""
-    a2 = ws["A2"].value or ""
+    if cache:
+        a1, a2, b15 = _read_header_cells(cache)
+    else:
+        with WorkbookCache(path, cache_dir="") as one_off:
+            a1, a2, b15 = _read_header_cells(one_off)
+
     year = _filename_year_from_eid(os.path.basename(path))
-    eid, title, start_date, end_date, place, country = _parse_event_header(a1, a2, year)
+    eid, title, start_date, end_date, place, country = _parse_event_header(a1 or "", a2 or "", year)
 
-    wws = wb["COST Overview"]
-    cost_overview_b15 = str(wws["B15"].value or "").strip()
+    cost_overview_b15 = str(b15 or "").strip()
     cost = float(cost_overview_b15) if cost_overview_b15 else None
     return eid, title, start_date, end_date, place, country, cost
 
@@ -1065,18 +1575,19 @@ def validate_excel_file_for_import(path: str) -> tuple[bool, list[str], dict]:
 
     missing: list[str] = []
 
-    wb = openpyxl.load_workbook(path, data_only=True)
-    if "Participants" not in wb.sheetnames:
-        missing.append("Sheet 'Participants'")
-        return False, missing, {}
-    if "COST Overview" not in wb.sheetnames:
-        missing.append("Sheet 'COST Overview'")
-        return False, missing, {}
-
-    ws, wws = wb["Participants"], wb["COST Overview"]
-    a1 = (ws["A1"].value or "").strip()
-    a2 = (ws["A2"].value or "").strip()
-    cost_overview_b15 = str(wws["B15"].value or "").strip()
+    # Header cells and the table list come from one WorkbookCache, which
+    # hands its extraction on to the parse_for_commit of this upload.
+    with WorkbookCache(path, publish=True) as cache:
+        try:
+            a1, a2, b15 = _read_header_cells(cache)
+        except _MissingSheetError as exc:
+            missing.append(f"Sheet '{exc.title}'")
+            return False, missing, {}
+        tables = cache.get_tables()
+
+    a1 = (a1 or "").strip()
+    a2 = (a2 or "").strip()
+    cost_overview_b15 = str(b15 or "").strip()
     if not a1:
         missing.append("Participants!A1 (eid + title)")
     if not a2:
@@ -1084,12 +1595,11 @@ def validate_excel_file_for_import(path: str) -> tuple[bool, list[str], dict]:
     if not cost_overview_b15:
         missing.append("Cost Overview!B15 (Total Cost)")
 
-    tables = list_tables(path)
     idx = _index_tables(tables)
 
-    if not _find_table_exact(idx, "ParticipantsLista"):
+    if _PARTICIPANTS_LISTA_KEY not in idx:
         missing.append("Table 'ParticipantsLista'")
-    if not any(_find_table_exact(idx, k) for k in COUNTRY_TABLE_MAP.keys()):
+    if not (_COUNTRY_TABLE_KEYS_NORM & idx.keys()):
         missing.append("At least one country table (tableAlb, tableBih, tableCro, etc.)")
 
     ok = len(missing) == 0
@@ -1116,84 +1626,104 @@ def inspect_and_preview_uploaded(path: str, *, preview_only: bool = True) -> Non
     cache = WorkbookCache(path)
     participant_lookup_enabled = not preview_only or PREVIEW_PARTICIPANT_LOOKUP
 
-    eid, title, start_date, end_date, place, country, cost = _read_event_header_block(path, cache)
+    # One cached read-only workbook serves the header and every table pass.
+    try:
+        eid, title, start_date, end_date, place, country, cost = _read_event_header_block(path, cache)
 
-    existing = mongodb.collection("events").find_one({"eid": eid})
-    if existing:
-        print(
-            f"[EVENT] EXIST {eid} title='{existing.get('title','')}' "
-            f"start_date={existing.get('start_date')} place='{existing.get('place','')}' "
-            f"country='{existing.get('country')}'"
-        )
-    else:
-        print(
-            f"[EVENT] NEW {eid} title='{title}' start_date={start_date} "
-            f"end_date={end_date} place='{place}' country='{country}'"
-        )
+        existing = mongodb.collection("events").find_one({"eid": eid})
+        if existing:
+            print(
+                f"[EVENT] EXIST {eid} title='{existing.get('title','')}' "
+                f"start_date={existing.get('start_date')} place='{existing.get('place','')}' "
+                f"country='{existing.get('country')}'"
+            )
+        else:
+            print(
+                f"[EVENT] NEW {eid} title='{title}' start_date={start_date} "
+                f"end_date={end_date} place='{place}' country='{country}'"
+            )
 
-    tables = list_tables(path)
-    idx = _index_tables(tables)
+        tables = cache.get_tables()
+        idx = _index_tables(tables)
 
-    plist = _find_table_exact(idx, "ParticipantsLista")
-    if not plist:
-        raise RuntimeError("Required table 'ParticipantsLista' not found (any sheet)")
+        plist = _find_table_norm(idx, _PARTICIPANTS_LISTA_KEY)
+        if not plist:
+            raise RuntimeError("Required table 'ParticipantsLista' not found (any sheet)")
 
-    df_positions = _read_table_df(path, plist, cache)
-    positions_lookup_full = _build_lookup_participantslista(df_positions)
+        df_positions = _read_table_df(path, plist, cache)
+        positions_lookup_full = _build_lookup_participantslista(df_positions)
 
-    print("[ATTENDEES]")
+        print("[ATTENDEES]")
 
-    for key, country_label in COUNTRY_TABLE_MAP.items():
-        t = _find_table_exact(idx, key)
-        if not t:
-            continue
+        country_tables = [
+            (t, country_label)
+            for _key, key_norm, country_label in _COUNTRY_TABLES_NORM
+            if (t := _find_table_norm(idx, key_norm))
+        ]
+        # CIDs are resolved once per table, and every present country's
+        # participants are fetched in a single query before the row loop;
+        # lookup() then serves all rows from that cache.
+        country_cids: Dict[str, Optional[str]] = {}
+        if participant_lookup_enabled:
+            country_cids = {label: get_country_cid_by_name(label) for _t, label in country_tables}
+            preload_participants(country_cids.values())
 
-        df = _read_table_df(path, t, cache)
-        if df.empty:
-            continue
+        for t, country_label in country_tables:
 
-        nm_col = next((c for c in df.columns if "name" in c.lower()), None)
-        grade_col = next((c for c in df.columns if "grade" in c.lower()), None)
+            header, rows = _read_table_rows(path, t, cache)
+            if not rows:
+                continue
 
-        if not nm_col:
-            continue
+            cols = _norm_cols(header)
+            nm_col = _find_col(cols, "name")
+            grade_col = _find_col(cols, "grade")
 
-        for _, row in df.iterrows():
-            name_cell = row.get(nm_col)
-            if name_cell is None or pd.isna(name_cell):
+            if not nm_col:
                 continue
+            nm_i = header.index(nm_col)
+            grade_i = header.index(grade_col) if grade_col else None
 
-            if isinstance(name_cell, str) and not name_cell.strip():
-                continue
+            country_cid = country_cids.get(country_label)
 
-            raw_name = _normalize(str(name_cell))
-            if not raw_name:
-                continue
+            # --- Column pass: keep named rows, then derive display names and
+            # lookup keys for the whole table in one map() each ---
+            named_rows: List[tuple[str, tuple]] = []
+            for row in rows:
+                name_cell = row[nm_i]
+                if name_cell is None:
+                    continue
+                raw_name = _normalize(str(name_cell))  # blank text normalizes to ''
+                if raw_name:
+                    named_rows.append((raw_name, row))
 
+            raw_names = [raw_name for raw_name, _ in named_rows]
             # --- normalize exactly like parse_for_commit ---
-            norm_name = _to_app_display_name(raw_name)
-
-            grade = _normalize(str(row.get(grade_col, ""))) if grade_col else ""
-            key_lookup = _name_key_from_raw(raw_name)
-            pos = positions_lookup_full.get(key_lookup, {}).get("position", "")
-
-            participant = None
-            if participant_lookup_enabled:
-                participant = lookup(
-                    name_display=norm_name,
-                    country_name=country_label,
-                    dob_source=None,
-                    representing_country=None,
+            display_names = map(_to_app_display_name, raw_names)
+            lookup_keys = map(_name_key_from_raw, raw_names)
+
+            for (raw_name, row), norm_name, key_lookup in zip(named_rows, display_names, lookup_keys):
+                grade = _normalize(str(row[grade_i])) if grade_i is not None else ""
+                pos = positions_lookup_full.get(key_lookup, {}).get("position", "")
+
+                participant = None
+                if participant_lookup_enabled:
+                    participant = lookup(
+                        name_display=norm_name,
+                        country_name=country_label,
+                        dob_source=None,
+                        representing_country=country_cid,
+                    )
+
+                star = "*" if not participant else " "
+                pid = participant.pid if participant else "NEW"
+
+                print(
+                    f"{star} {'NEW' if star == '*' else 'EXIST'} {pid:>6} "
+                    f"{norm_name} ({grade}, {country_label}) "
+                    f"{'pos=' + pos if pos else ''}"
                 )
-
-            star = "*" if not participant else " "
-            pid = participant.pid if participant else "NEW"
-
-            print(
-                f"{star} {'NEW' if star == '*' else 'EXIST'} {pid:>6} "
-                f"{norm_name} ({grade}, {country_label}) "
-                f"{'pos=' + pos if pos else ''}"
-            )
+    finally:
+        cache.clear()
 
 # ==============================================================================
 # 15. Utility Fill Helper
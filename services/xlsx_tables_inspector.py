@@ -6,14 +6,17 @@ import re
 import sys
 import zipfile
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # XML namespaces
 NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
 NS_REL  = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 NS_PKG  = "http://schemas.openxmlformats.org/package/2006/relationships"
 
+_NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]+")
+
 # -----------------------
 # Data structures
 # -----------------------
@@ -39,7 +42,7 @@ def _norm_name(s: str | None) -> str:
     """normalize names for matching: lowercase, remove all non-alphanumerics."""
     if not s:
         return ""
-    return re.sub(r"[^0-9a-zA-Z]+", "", s).lower()
+    return _NON_ALNUM_RE.sub("", s).lower()
 
 def _read_xml(zf: zipfile.ZipFile, path: str) -> Optional[ET.Element]:
     try:
@@ -58,15 +61,53 @@ def _resolve_rel_target(base_xml_path: str, target: str) -> str:
         return target.lstrip("/")
     return posixpath.normpath(posixpath.join(base_dir, target))
 
+_TABLE_PARTS_TAG = f"{{{NS_MAIN}}}tableParts"
+_TABLE_PART_TAG = f"{{{NS_MAIN}}}tablePart"
+_ROW_TAG = f"{{{NS_MAIN}}}row"
+_RID_ATTR = f"{{{NS_REL}}}id"
+
+
+def _table_part_ids(zf: zipfile.ZipFile, xml_path: str) -> List[str]:
+    """
+    r:ids of the worksheet's <tableParts>, in document order. The sheet is
+    streamed (finished rows are cleared) and reading stops at </tableParts>.
+    """
+    ids: List[str] = []
+    try:
+        with zf.open(xml_path) as fh:
+            for _event, elem in ET.iterparse(fh):
+                tag = elem.tag
+                if tag == _ROW_TAG:
+                    elem.clear()
+                elif tag == _TABLE_PART_TAG:
+                    rid = elem.get(_RID_ATTR)
+                    if rid:
+                        ids.append(rid)
+                elif tag == _TABLE_PARTS_TAG:
+                    break
+    except (KeyError, ET.ParseError):
+        return []
+    return ids
+
 # -----------------------
 # Core logic
 # -----------------------
 
-def list_sheets(path: str) -> List[SheetRef]:
+@contextmanager
+def _open_zip(source: Union[str, zipfile.ZipFile]) -> Iterator[zipfile.ZipFile]:
+    """Yield an open ZipFile for `source`; only close it if we opened it here."""
+    if isinstance(source, zipfile.ZipFile):
+        yield source
+        return
+    with zipfile.ZipFile(source) as zf:
+        yield zf
+
+def list_sheets(source: Union[str, zipfile.ZipFile]) -> List[SheetRef]:
     """
     Return a list of worksheets with their human title and XML path inside the XLSX.
+    `source` is a path or an already-open ZipFile of the workbook.
     """
-    with zipfile.ZipFile(path) as zf:
+    with _open_zip(source) as zf:
         wb = _read_xml(zf, "xl/workbook.xml")
         if wb is None:
             return []
@@ -98,30 +139,28 @@ def list_sheets(path: str) -> List[SheetRef]:
                 out.append(SheetRef(title=title, xml_path=sheet_xml))
         return out
 
-def list_tables(path: str) -> List[TableRef]:
+def list_tables(source: Union[str, zipfile.ZipFile]) -> List[TableRef]:
     """
     Scan all worksheets, follow their relationships to table parts, and return all tables.
-    Works without openpyxl; reads the XLSX zip directly.
+    Works without openpyxl; reads the XLSX zip directly (opened once).
+
+    Only tables the sheet lists in <tableParts> count (editors can leave
+    orphaned table relationships behind), in that order. Sheets whose
+    relationships file has no table targets are skipped without reading
+    their (potentially large) worksheet XML.
     """
     tables: List[TableRef] = []
-    with zipfile.ZipFile(path) as zf:
-        sheets = list_sheets(path)
-
-        for s in sheets:
-            # Find tablePart r:ids inside the sheet XML
-            sheet_xml = _read_xml(zf, s.xml_path)
-            if sheet_xml is None:
-                continue
-            table_parts = sheet_xml.findall(f".//{{{NS_MAIN}}}tableParts/{{{NS_MAIN}}}tablePart")
-            if not table_parts:
-                continue
-
+    with _open_zip(source) as zf:
+        names = set(zf.namelist())
+        for s in list_sheets(zf):
             # Read this sheet's relationships to map r:id -> table Target
             rels_path = posixpath.join(
                 posixpath.dirname(s.xml_path),
                 "_rels",
                 posixpath.basename(s.xml_path) + ".rels",
             )
+            if rels_path not in names:
+                continue
             rels = _read_xml(zf, rels_path)
             if rels is None:
                 continue
@@ -133,12 +172,13 @@ def list_tables(path: str) -> List[TableRef]:
                 tgt = rel.get("Target", "")
                 if rid and tgt and typ.endswith("/table"):
                     rid_to_target[rid] = tgt
+            if not rid_to_target:
+                continue
 
-            for tp in table_parts:
-                rid = tp.get(f"{{{NS_REL}}}id")  # r:id
-                if not rid or rid not in rid_to_target:
+            for rid in _table_part_ids(zf, s.xml_path):
+                tgt = rid_to_target.get(rid)
+                if not tgt:
                     continue
-                tgt = rid_to_target[rid]
                 table_xml_path = _resolve_rel_target(s.xml_path, tgt)
 
                 # Load table xml and read attributes
@@ -56,3 +56,20 @@ def test_ensure_country_reuses_existing_and_inserts_new_entries():
     assert collection.inserted == [{"cid": "c002", "country": "Newland"}]
 
     assert country_resolver.ensure_country(collection, country_lookup, None) == "c000"
+
+
+def test_get_country_cid_by_name_memoizes_lookups(monkeypatch):
+    calls = []
+
+    def fake_cache():
+        calls.append(1)
+        return [{"cid": "C054", "country": "Croatia", "_lower": "croatia", "_normalized": "croatia"}]
+
+    monkeypatch.setattr(country_resolver, "get_country_cache", fake_cache)
+    monkeypatch.setattr(country_resolver, "CID_BY_NAME_CACHE", {})
+
+    assert country_resolver.get_country_cid_by_name("Croatia") == "C054"
+    assert country_resolver.get_country_cid_by_name("Croatia") == "C054"
+    assert country_resolver.get_country_cid_by_name("Atlantis") is None
+    assert country_resolver.get_country_cid_by_name("Atlantis") is None
+    assert len(calls) == 2
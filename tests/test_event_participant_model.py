@@ -0,0 +1,11 @@
+from datetime import UTC, datetime
+
+import pandas as pd
+
+from domain.models.event_participant import EventParticipant
+
+
+def test_to_datetime_utc_converts_pandas_timestamp():
+    result = EventParticipant._to_datetime_utc(pd.Timestamp("2024-02-01"))
+    assert type(result) is datetime
+    assert result == datetime(2024, 2, 1, tzinfo=UTC)
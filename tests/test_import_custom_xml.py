@@ -102,3 +102,69 @@ def test_parse_custom_xml_creates_objects(tmp_path):
     assert preview["event"]["start_date"] == "2024-02-01"
     assert preview["participants"][0]["grade"] == 2
     assert preview["participant_events"][0]["participant_id"] == "P-001"
+
+
+def test_coerce_event_type_ignores_case():
+    from domain.models.event import EventType
+
+    assert import_service._coerce_event_type("study TRIP") is EventType.study_trip
+    assert import_service._coerce_event_type(" workshop ") is EventType.workshop
+    assert import_service._coerce_event_type(EventType.other) is EventType.other
+    assert import_service._coerce_event_type("conference") is None
+    assert import_service._coerce_event_type("") is None
+
+
+def test_invalid_custom_xml_participant_is_dropped_from_batch(tmp_path):
+    broken = XML_CONTENT.replace(
+        "<participant_event>",
+        "<participant><pid>P-002</pid></participant>\n  <participant_event>",
+        1,
+    )
+    xlsx_path = tmp_path / "broken.xlsx"
+    with zipfile.ZipFile(xlsx_path, "w") as zf:
+        zf.writestr("customXml/item1.xml", broken)
+
+    bundle = import_service._load_custom_xml_objects(str(xlsx_path))
+
+    assert import_service._build_participant_from_record({"pid": "P-002"}) is None
+    assert [p.pid for p in bundle["participants"]] == ["P-001"]
+    assert len(bundle["participant_events"]) == 1
+
+
+def test_custom_xml_parts_are_collected_in_archive_order(tmp_path):
+    xlsx_path = tmp_path / "parts.xlsx"
+    with zipfile.ZipFile(xlsx_path, "w") as zf:
+        zf.writestr("customXml/item1.xml", "<data><participant><pid>P-1</pid></participant></data>")
+        zf.writestr("customXml/item2.xml", "<data><participant>")  # malformed: skipped
+        zf.writestr("customXml/item3.xml", "<data><participant><pid>P-3</pid></participant></data>")
+
+    records = import_service._collect_custom_xml_records(str(xlsx_path))
+
+    assert [r["pid"] for r in records["participants"]] == ["P-1", "P-3"]
+
+
+def test_custom_xml_parsers_agree(monkeypatch, tmp_path):
+    xlsx_path = _write_custom_xml_file(tmp_path / "custom.xlsx")
+    records = import_service._collect_custom_xml_records(str(xlsx_path))
+
+    monkeypatch.setattr(import_service, "LET", None)  # force the ElementTree fallback
+    assert import_service._collect_custom_xml_records(str(xlsx_path)) == records
+
+
+def test_small_custom_xml_parts_are_parsed_inline(monkeypatch, tmp_path):
+    xlsx_path = tmp_path / "inline.xlsx"
+    with zipfile.ZipFile(xlsx_path, "w") as zf:
+        zf.writestr("customXml/item1.xml", XML_CONTENT)
+        zf.writestr("customXml/itemProps1.xml", "<ds:datastoreItem xmlns:ds='urn:ds'/>")
+        zf.writestr("customXml/item2.xml", "<data><participant><pid>P-2</pid></participant></data>")
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool started for small parts")
+
+    monkeypatch.setattr(import_service, "ThreadPoolExecutor", no_pool)
+    records = import_service._collect_custom_xml_records(str(xlsx_path))
+    assert [r["pid"] for r in records["participants"]] == ["P-001", "P-2"]
+
+    monkeypatch.undo()
+    monkeypatch.setattr(import_service, "_CUSTOM_XML_PARALLEL_MIN_BYTES", 0)
+    assert import_service._collect_custom_xml_records(str(xlsx_path)) == records
@@ -261,3 +261,49 @@ def test_main_online_birth_country_falls_back_to_representing(tmp_path):
     assert attendee["representing_country"] == "Serbia, Europe & Eurasia"
     assert attendee["birth_country"] == "C194"
 
+
+
+def test_fuzzy_name_matches_skip_claimed_and_ambiguous_keys():
+    entry = ({"dob": "1980-01-01"}, None)
+    combined = {
+        "kovacevic|ana": entry,
+        "horvatovic|marko": entry,
+        "petrovic|ivana": entry,
+    }
+
+    hits = import_service._fuzzy_name_matches(
+        ["Ana Kovacevc", "Marko Horvatovc", "Marco Horvatovic", "Ivana Petrovc"],
+        combined,
+        claimed={"petrovic|ivana"},
+    )
+
+    # Kovacevic: unique near miss; Horvatovic: two names reach it; Petrovic: taken exactly
+    assert hits == {"Ana Kovacevc": "kovacevic|ana"}
+
+
+def test_name_only_position_entries_are_read_only():
+    import pandas as pd
+    import pytest
+
+    df = pd.DataFrame({"Name (Latin)": ["KOVAČ, Ana", "HORVAT, Ivan"], "Position": ["", ""]})
+    lookup = import_service._build_lookup_participantslista(df)
+
+    entry = lookup[import_service._name_key_from_raw("KOVAČ, Ana")]
+    assert entry["position"] == ""
+    with pytest.raises(TypeError):
+        entry["position"] = "Advisor"
+
+
+def test_column_finders_keep_first_occurrence_and_first_match():
+    import pandas as pd
+
+    cols = import_service._norm_cols(["Name (Latin)", "Mobile phone", "Phone", "name (latin) "])
+    assert cols["name (latin)"] == "Name (Latin)"
+    assert import_service._find_col(cols, "phone") == "Mobile phone"
+
+    df = pd.DataFrame(
+        [["KOVAČ, Ana", "Advisor", "Intern"]],
+        columns=["Name (Latin)", "Position", "Position"],
+    )
+    lookup = import_service._build_lookup_participantslista(df)
+    assert lookup[import_service._name_key_from_raw("KOVAČ, Ana")]["position"] == "Advisor"
@@ -33,3 +33,26 @@ def test_build_lookup_main_online_translates_fields():
     assert entry["rank"].lower() == "army colonel"
     assert entry["bio_short"].lower() == "short biography of the participant"
 
+
+
+def test_build_lookup_main_online_translates_each_distinct_value_once(monkeypatch):
+    calls = []
+
+    def fake_translate(text, output_lang, input_lang=None):
+        calls.append(text)
+        return text.upper()
+
+    monkeypatch.setattr(import_service, "translate", fake_translate)
+    df = pd.DataFrame(
+        {
+            "Name": ["Ana", "Ivo", "Marko"],
+            "Last name": ["Kovač", "Horvat", "Babić"],
+            "Organization": ["ministarstvo", "ministarstvo", "policija"],
+            "Rank": ["policija", "", ""],
+        }
+    )
+
+    lookup = import_service._build_lookup_main_online(df)
+
+    assert sorted(calls) == ["", "ministarstvo", "policija"]
+    assert {entry["organization"] for entry in lookup.values()} == {"MINISTARSTVO", "POLICIJA"}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from tests.test_import_service_gender import _workbook_bytes_with_gender
 
 import services.import_service_v2 as import_service
@@ -23,3 +25,154 @@ def test_parse_for_commit_loads_workbook_once(monkeypatch, tmp_path):
 
     assert result["preview"]["participants"], "Expected JSON preview data"
     assert load_calls == 1, "Workbook should only be loaded once"
+
+
+def test_calamine_table_reads_match_openpyxl(tmp_path):
+    pytest.importorskip("python_calamine")
+
+    workbook_path = tmp_path / "calamine.xlsx"
+    workbook_path.write_bytes(_workbook_bytes_with_gender("Male"))
+    tables = import_service.list_tables(str(workbook_path))
+
+    calamine_cache = import_service.WorkbookCache(str(workbook_path))
+    openpyxl_cache = import_service.WorkbookCache(str(workbook_path))
+    openpyxl_cache._calamine_failed = True  # force the openpyxl fallback
+
+    try:
+        for table in tables:
+            fast = import_service._read_table_values(str(workbook_path), table, calamine_cache)
+            slow = import_service._read_table_values(str(workbook_path), table, openpyxl_cache)
+            assert fast == slow, table.name
+        assert calamine_cache.get_sheet_values("Cro") is not None
+    finally:
+        calamine_cache.clear()
+        openpyxl_cache.clear()
+
+
+def test_disk_cache_skips_workbook_parsing_on_repeat(monkeypatch, tmp_path):
+    import utils.excel as excel_utils
+
+    workbook_path = tmp_path / "disk.xlsx"
+    workbook_path.write_bytes(_workbook_bytes_with_gender("Male"))
+    monkeypatch.setattr(excel_utils, "IMPORT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(excel_utils, "CalamineWorkbook", None)
+
+    load_calls = 0
+    real_load = import_service.openpyxl.load_workbook
+
+    def counting_loader(*args, **kwargs):
+        nonlocal load_calls
+        load_calls += 1
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(import_service.openpyxl, "load_workbook", counting_loader)
+
+    first = import_service.parse_for_commit(str(workbook_path))
+    assert load_calls == 1
+    assert list((tmp_path / "cache").glob("*.json"))
+
+    second = import_service.parse_for_commit(str(workbook_path))
+    assert load_calls == 1, "Unchanged workbook should be served from the disk cache"
+    assert second["attendees"] == first["attendees"]
+
+
+def test_validate_and_parse_share_one_table_scan(monkeypatch, tmp_path):
+    import services.xlsx_tables_inspector as inspector
+
+    workbook_path = tmp_path / "shared.xlsx"
+    workbook_path.write_bytes(_workbook_bytes_with_gender("Male"))
+
+    scans = 0
+    real_list_tables = inspector.list_tables
+
+    def counting_list_tables(source):
+        nonlocal scans
+        scans += 1
+        return real_list_tables(source)
+
+    monkeypatch.setattr(inspector, "list_tables", counting_list_tables)
+
+    import_service.validate_excel_file_for_import(str(workbook_path))
+    import_service.parse_for_commit(str(workbook_path))
+
+    assert scans == 1, "parse should reuse the tables found during validation"
+
+
+def test_shared_extraction_is_dropped_after_parse(tmp_path):
+    import utils.excel as excel_utils
+
+    workbook_path = tmp_path / "handoff.xlsx"
+    workbook_path.write_bytes(_workbook_bytes_with_gender("Male"))
+
+    key = str(workbook_path.resolve())
+    import_service.validate_excel_file_for_import(str(workbook_path))
+    assert key in excel_utils._shared_extractions
+
+    import_service.parse_for_commit(str(workbook_path))
+    assert key not in excel_utils._shared_extractions
+
+
+def test_republished_workbook_is_read_fresh(monkeypatch, tmp_path):
+    import utils.excel as excel_utils
+
+    workbook_path = tmp_path / "reupload.xlsx"
+    workbook_path.write_bytes(_workbook_bytes_with_gender("Male"))
+    import_service.validate_excel_file_for_import(str(workbook_path))
+
+    # Same path, same stat signature: a re-validation must still not reuse it
+    monkeypatch.setattr(excel_utils, "_take_shared", lambda path: pytest.fail("publisher took a hand-off"))
+    import_service.validate_excel_file_for_import(str(workbook_path))
+    excel_utils._drop_shared(str(workbook_path.resolve()))
+
+
+def test_shared_extraction_expires(monkeypatch, tmp_path):
+    import utils.excel as excel_utils
+
+    workbook_path = tmp_path / "stale.xlsx"
+    workbook_path.write_bytes(b"xlsx")
+    key = str(workbook_path.resolve())
+    excel_utils._publish_shared(key, excel_utils._stat_signature(key), {"tables": None})
+
+    later = excel_utils.time.monotonic() + excel_utils._SHARED_TTL_SECONDS + 1
+    monkeypatch.setattr(excel_utils.time, "monotonic", lambda: later)
+    assert excel_utils._take_shared(key) is None
+    assert key not in excel_utils._shared_extractions
+
+
+def test_disk_extraction_round_trips_cell_types():
+    import json
+    from datetime import date, datetime, time, timedelta
+
+    import utils.excel as excel_utils
+    from services.xlsx_tables_inspector import TableRef
+
+    rows = [("Name", 1, 2.5, True, None, datetime(2024, 2, 1, 10), date(2024, 2, 1),
+             time(9, 30), timedelta(days=1, seconds=5))]
+    data = {
+        "version": excel_utils._DISK_CACHE_VERSION,
+        "tables": [TableRef("tableCro", "tablecro", "Cro", "A1:B2", "xl/tables/table1.xml")],
+        "values": {("Cro", "A1:B2"): rows},
+        "cells": {("Participants", ("A1", "A2")): ("E1 TITLE", None)},
+    }
+
+    text = json.dumps(excel_utils._dump_extraction(data), default=excel_utils._encode_cell)
+    assert excel_utils._load_extraction(json.loads(text, object_hook=excel_utils._decode_cell)) == data
+
+
+def test_disk_cache_prunes_old_and_surplus_files(monkeypatch, tmp_path):
+    import os
+    import time
+
+    import utils.excel as excel_utils
+
+    monkeypatch.setattr(excel_utils, "_DISK_CACHE_MAX_FILES", 2)
+    now = time.time()
+    for name, age in (("a.json", 10), ("b.json", 20), ("c.json", 30),
+                      ("old.json", excel_utils._DISK_CACHE_MAX_AGE_SECONDS + 60), ("legacy.pkl", 0)):
+        path = tmp_path / name
+        path.write_text("{}")
+        os.utime(path, (now - age, now - age))
+
+    excel_utils._prune_disk_cache(str(tmp_path))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "b.json"]
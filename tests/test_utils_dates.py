@@ -26,6 +26,12 @@ def test_normalize_dob_handles_pandas_timestamp():
     assert normalize_dob(ts) == datetime(1985, 5, 5)
 
 
+def test_coerce_datetime_returns_plain_datetime_for_pandas_timestamp():
+    result = coerce_datetime(pd.Timestamp("2024-02-01 10:00"))
+    assert type(result) is datetime
+    assert result == datetime(2024, 2, 1, 10, 0)
+
+
 def test_normalize_dob_rejects_ghost_date():
     assert normalize_dob("1900-01-01") is None
 
@@ -58,3 +64,11 @@ def test_coerce_datetime_handles_excel_serial_numbers():
 def test_date_to_iso_handles_strings_and_excel_serials():
     assert date_to_iso("1999-12-31") == "1999-12-31"
     assert date_to_iso(45000) == "2023-03-15"
+
+
+def test_date_to_iso_handles_dates_and_datetimes():
+    tz = ZoneInfo("Europe/Zagreb")
+    assert date_to_iso(datetime(2024, 5, 1, 23, 30), tzinfo=tz) == "2024-05-01"
+    assert date_to_iso(datetime(2024, 5, 1).date(), tzinfo=tz) == "2024-05-01"
+    # Aware values are converted first, which may move them to the next day.
+    assert date_to_iso(datetime(2024, 5, 1, 23, 30, tzinfo=timezone.utc), tzinfo=tz) == "2024-05-02"
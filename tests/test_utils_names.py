@@ -1,6 +1,10 @@
 from utils.names import (
+    _canon,
+    _fuzzy_key_match,
+    _edit_distance_within,
     _name_key,
     _name_key_from_raw,
+    _name_keys,
     _split_name_variants,
     _to_app_display_name,
     normalize_name,
@@ -13,6 +17,13 @@ def test_name_key_from_raw_handles_commas_and_spaces():
     assert _name_key_from_raw("John Paul Smith") == expected
 
 
+def test_name_keys_match_name_key_per_variant():
+    assert _name_keys("Kovačević", "Ana Marija", "Ana") == [
+        _name_key("Kovačević", "Ana Marija"),
+        _name_key("Kovačević", "Ana"),
+    ]
+
+
 def test_split_name_variants_emits_possible_surnames():
     variants = list(_split_name_variants("John Michael Van Der Meer"))
     assert variants == [
@@ -30,3 +41,48 @@ def test_normalize_name_uppercases_last_but_preserves_all_caps():
 def test_to_app_display_name_handles_last_first_input():
     assert _to_app_display_name("SMITH, John") == "John SMITH"
     assert _to_app_display_name("Jane Doe") == "Jane DOE"
+
+
+def test_canon_strips_accents_and_lowercases():
+    assert _canon("KOVAČ") == "kovac"
+    assert _canon("Ana") == "ana"
+    assert _canon("") == ""
+
+
+def test_fuzzy_key_match_finds_close_key_within_distance():
+    keys = [_name_key("Kovacevic", "Ana"), _name_key("Horvat", "Ivan")]
+    assert _fuzzy_key_match(_name_key("Kovacevi", "Ana"), keys) == keys[0]
+    assert _fuzzy_key_match(_name_key("Novak", "Petra"), keys) is None
+
+
+def test_fuzzy_key_match_allows_one_edit_on_short_keys():
+    keys = [_name_key("Ivic", "Ina"), _name_key("Ilic", "Ivan")]
+    assert _fuzzy_key_match(_name_key("Ilic", "Ana"), keys) is None
+    assert _fuzzy_key_match(_name_key("Ilic", "Iván"), keys) == keys[1]
+    assert _fuzzy_key_match(_name_key("Ilic", "Ivn"), keys) == keys[1]
+
+
+def test_fuzzy_key_match_rejects_ties():
+    keys = [_name_key("Kovacevic", "Anna"), _name_key("Kovacevic", "Ane")]
+    assert _fuzzy_key_match(_name_key("Kovacevic", "Ana"), keys) is None
+
+
+def test_edit_distance_within_stops_past_threshold():
+    assert _edit_distance_within("kovac", "kovacs", 2) == 1
+    assert _edit_distance_within("kovac", "horvat", 2) is None
+
+
+def test_edit_distance_within_counts_transposition_once():
+    assert _edit_distance_within("kovacevic", "kovacveic", 2) == 1
+    assert _edit_distance_within("ab", "ba", 0) is None
+
+
+def test_fuzzy_key_match_backends_agree(monkeypatch):
+    import utils.names as names
+
+    keys = [_name_key("Kovacevic", "Ana"), _name_key("Kovacevic", "Anna"), _name_key("Ilic", "Ivan")]
+    targets = [_name_key("Kovacevci", "Ana"), _name_key("Kovacevic", "Ane"), _name_key("Ilic", "Ana")]
+    results = [_fuzzy_key_match(t, keys) for t in targets]
+
+    monkeypatch.setattr(names, "_rf_process", None)  # force the pure-Python scan
+    assert [_fuzzy_key_match(t, keys) for t in targets] == results
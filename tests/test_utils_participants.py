@@ -24,3 +24,36 @@ def test_normalize_gender_returns_none_for_unknown_or_empty():
     assert _normalize_gender(None) is None
     assert _normalize_gender(float("nan")) is None
     assert _normalize_gender(pd.NA) is None
+
+
+def test_lookup_cache_preload_uses_one_query_for_all_countries():
+    from types import SimpleNamespace
+
+    from utils.participants import ParticipantLookupCache
+
+    class FakeRepo:
+        def __init__(self):
+            self.calls = []
+
+        def find_by_countries(self, cids):
+            self.calls.append(("many", list(cids)))
+            return [SimpleNamespace(pid="P0001", name="Ana KOVAC", representing_country="C054", dob=None)]
+
+        def find_by_country(self, cid):
+            self.calls.append(("one", cid))
+            return []
+
+    repo = FakeRepo()
+    cache = ParticipantLookupCache(repo)
+    cache.preload(["C054", "C117", "C054", None])
+
+    found = cache.find_by_display_name_country_and_dob(
+        name_display="Ana KOVAC", country_name="Croatia", representing_country="C054"
+    )
+    missing = cache.find_by_display_name_country_and_dob(
+        name_display="Ana KOVAC", country_name="Kosovo", representing_country="C117"
+    )
+
+    assert found.pid == "P0001"
+    assert missing is None
+    assert repo.calls == [("many", ["C054", "C117"])]
@@ -0,0 +1,54 @@
+import io
+import zipfile
+import xml.etree.ElementTree as ET
+
+from openpyxl import Workbook
+from openpyxl.worksheet.table import Table
+
+from services.xlsx_tables_inspector import NS_PKG, list_tables
+
+
+def _workbook_with_tables(path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Participants"
+    ws.append(["Name", "Grade"])
+    ws.append(["Ana", 1])
+    ws.add_table(Table(displayName="tableAlb", ref="A1:B2"))
+    ws["D1"], ws["D2"] = "Name", "Ivan"
+    ws.add_table(Table(displayName="tableCro", ref="D1:D2"))
+    wb.save(path)
+
+
+def _rewrite_sheet_rels(path):
+    """Reverse the table relationships and add an orphaned one (no <tablePart>)."""
+    rels_path = "xl/worksheets/_rels/sheet1.xml.rels"
+    with zipfile.ZipFile(path) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist()}
+    ET.register_namespace("", NS_PKG)
+    rels = ET.fromstring(parts[rels_path])
+    children = list(rels)
+    for child in children:
+        rels.remove(child)
+    for child in reversed(children):
+        rels.append(child)
+    orphan = ET.SubElement(rels, f"{{{NS_PKG}}}Relationship")
+    orphan.set("Id", "rIdOrphan")
+    orphan.set("Type", children[0].get("Type"))
+    orphan.set("Target", "../tables/table99.xml")
+    parts[rels_path] = ET.tostring(rels)
+    parts["xl/tables/table99.xml"] = parts["xl/tables/table1.xml"].replace(b"tableAlb", b"tableOld")
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+    path.write_bytes(buffer.getvalue())
+
+
+def test_list_tables_follows_table_parts_order_and_skips_orphans(tmp_path):
+    path = tmp_path / "tables.xlsx"
+    _workbook_with_tables(path)
+    _rewrite_sheet_rels(path)
+
+    assert [t.name for t in list_tables(str(path))] == ["tableAlb", "tableCro"]
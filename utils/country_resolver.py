@@ -1,6 +1,8 @@
 # utils/country_resolver.py
 import re
+import sys
 import unicodedata
+from functools import lru_cache
 from typing import Iterable, Optional, Dict, List, TypedDict
 from config.database import mongodb
 
@@ -16,6 +18,7 @@ class _CountryCacheEntry(TypedDict):
 
 COUNTRY_CACHE: Optional[List[_CountryCacheEntry]] = None
 RESOLVE_CACHE: Dict[str, Optional[Dict[str, str]]] = {}
+CID_BY_NAME_CACHE: Dict[str, Optional[str]] = {}
 
 
 def ensure_country(countries_col, country_lookup: dict, name: str) -> str:
@@ -118,7 +121,9 @@ def get_country_cache() -> List[_CountryCacheEntry]:
         name_str = str(country_name)
         cache.append(
             _CountryCacheEntry(
-                cid=cid,
+                # Interned: the same few CIDs are repeated across every attendee
+                # record (representing/birth country, citizenships).
+                cid=sys.intern(str(cid)),
                 country=name_str,
                 _lower=name_str.lower(),
                 _normalized=_normalize_ascii(name_str),
@@ -167,34 +172,10 @@ _SKIP_VALUES = {
 # Flexible Resolver
 # ==============================================================================
 
-def resolve_country_flexible(raw_value: str) -> Optional[Dict[str, str]]:
-    """
-    Resolve a country reference (citizenship, birth_country, representing_country)
-    into {'cid': 'Cxxx', 'country': '<value from Mongo>'}.
-
-    Handles:
-    - Partial words and prefixes (e.g. 'Kosovar' -> Kosovo)
-    - Local names (Hrvatska -> Croatia, Srbija -> Serbia, Makedonija -> North Macedonia)
-    - Multi-word variants (R. Serbia, BiH, Sjeverna Makedonija)
-    - Reads cid and country directly from MongoDB, never hardcoded
-    """
-
-    text = str(raw_value or "")
-    if text in RESOLVE_CACHE:
-        return RESOLVE_CACHE[text]
-    if not text:
-        RESOLVE_CACHE[text] = None
-        return None
-
-    s = _normalize_ascii(text)
-    if s in _SKIP_VALUES:
-        RESOLVE_CACHE[text] = None
-        return None
-
-    countries = get_country_cache()
-
-    # --- Aliases and Prefix Rules (normalized lowercase forms) ---
-    alias_rules = [
+# --- Aliases and Prefix Rules (normalized lowercase forms), compiled once ---
+_ALIAS_RULES: List[tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern), canonical)
+    for pattern, canonical in [
         # Albania / Albanian
         (r"^(alb|albanian)\b", "Albania"),
 
@@ -225,12 +206,40 @@ def resolve_country_flexible(raw_value: str) -> Optional[Dict[str, str]]:
         (r"\brepublika\s*srbija\b", "Serbia"),
         (r"\bserbian\b", "Serbia"),
     ]
+]
+
+
+def resolve_country_flexible(raw_value: str) -> Optional[Dict[str, str]]:
+    """
+    Resolve a country reference (citizenship, birth_country, representing_country)
+    into {'cid': 'Cxxx', 'country': '<value from Mongo>'}.
+
+    Handles:
+    - Partial words and prefixes (e.g. 'Kosovar' -> Kosovo)
+    - Local names (Hrvatska -> Croatia, Srbija -> Serbia, Makedonija -> North Macedonia)
+    - Multi-word variants (R. Serbia, BiH, Sjeverna Makedonija)
+    - Reads cid and country directly from MongoDB, never hardcoded
+    """
+
+    text = str(raw_value or "")
+    if text in RESOLVE_CACHE:
+        return RESOLVE_CACHE[text]
+    if not text:
+        RESOLVE_CACHE[text] = None
+        return None
+
+    s = _normalize_ascii(text)
+    if s in _SKIP_VALUES:
+        RESOLVE_CACHE[text] = None
+        return None
+
+    countries = get_country_cache()
 
     result: Optional[Dict[str, str]] = None
 
     # --- 1. Try alias/prefix recognition first ---
-    for pattern, canonical in alias_rules:
-        if re.search(pattern, s):
+    for pattern, canonical in _ALIAS_RULES:
+        if pattern.search(s):
             doc = _find_country_by_prefix(countries, canonical)
             if doc:
                 result = _format_country_result(doc)
@@ -263,10 +272,15 @@ def resolve_country_flexible(raw_value: str) -> Optional[Dict[str, str]]:
 # Find country cid by name
 # ==============================================================================
 def get_country_cid_by_name(name: str) -> Optional[str]:
+    """Return the cid of the first country whose name starts with ``name`` (memoized)."""
     if not name:
         return None
+    if name in CID_BY_NAME_CACHE:
+        return CID_BY_NAME_CACHE[name]
     doc = _find_country_by_prefix(get_country_cache(), name)
-    return doc["cid"] if doc else None
+    cid = doc["cid"] if doc else None
+    CID_BY_NAME_CACHE[name] = cid
+    return cid
 
 
 def normalize_citizenships(values: Iterable[str | None]) -> list[str]:
@@ -286,6 +300,11 @@ def normalize_citizenships(values: Iterable[str | None]) -> list[str]:
     return normalized
 
 
+_R_DOT_RE = re.compile(r"\bR\.\s*", re.IGNORECASE)
+# split on commas, semicolons, slashes, EN 'and', HR 'i'
+_MULTI_COUNTRY_SPLIT_RE = re.compile(r"[;,/]|(?:\band\b)|(?:\bi\b)", re.IGNORECASE)
+
+
 def _split_multi_country(value) -> list[str]:
     """
     Split values like 'BiH i RH', 'Bosnia and Herzegovina, R. Serbia',
@@ -299,18 +318,22 @@ def _split_multi_country(value) -> list[str]:
 
     out: list[str] = []
     for item in seq:
-        s = str(item or "")
-        if not s.strip():
-            continue
-        # normalize a couple of common patterns before splitting
-        s = re.sub(r"\bR\.\s*", "R ", s, flags=re.IGNORECASE)  # 'R. Serbia' → 'R Serbia'
-        s = s.replace("&", " and ")
-        # split on commas, semicolons, slashes, EN 'and', HR 'i'
-        parts = re.split(r"[;,/]|(?:\band\b)|(?:\bi\b)", s, flags=re.IGNORECASE)
-        out.extend(p.strip() for p in parts if p and p.strip())
+        out.extend(_split_country_text(str(item or "")))
     return out
 
 
+@lru_cache(maxsize=1024)
+def _split_country_text(s: str) -> tuple[str, ...]:
+    """Tokens of one citizenship cell; the same few spellings repeat across imports."""
+    if not s.strip():
+        return ()
+    # normalize a couple of common patterns before splitting
+    s = _R_DOT_RE.sub("R ", s)  # 'R. Serbia' → 'R Serbia'
+    s = s.replace("&", " and ")
+    parts = _MULTI_COUNTRY_SPLIT_RE.split(s)
+    return tuple(p.strip() for p in parts if p and p.strip())
+
+
 def _find_country_by_prefix(
     countries: List[_CountryCacheEntry],
     candidate: str,
@@ -30,11 +30,12 @@ MONTHS: Dict[str, int] = {
 
 _EXCEL_EPOCH = datetime(1899, 12, 30)
 _GHOST_DATES = {date_cls(1900, 1, 1)}  # Excel "empty" date
-_DATE_PATTERNS = {
-    "ymd": re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$"),
-    "dmy": re.compile(r"^\d{1,2}\.\d{1,2}\.\d{4}$"),
-    "mdy": re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"),
-}
+# (bound pattern.match, strptime format) for the non-ISO spellings we accept
+_DATE_FORMATS = (
+    (re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$").match, "%Y-%m-%d"),
+    (re.compile(r"^\d{1,2}\.\d{1,2}\.\d{4}$").match, "%d.%m.%Y"),
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$").match, "%m/%d/%Y"),
+)
 
 
 def _is_excel_number(value: object) -> bool:
@@ -74,21 +75,45 @@ def _parse_date_string(value: str) -> Optional[datetime]:
     text = value.strip()
     if not text:
         return None
+    # ISO strings are the common case; fromisoformat is a C fast path that
+    # parses them exactly like the "%Y-%m-%d" strptime format would.
     try:
-        if _DATE_PATTERNS["ymd"].match(text):
-            return datetime.strptime(text, "%Y-%m-%d")
-        if _DATE_PATTERNS["dmy"].match(text):
-            return datetime.strptime(text, "%d.%m.%Y")
-        if _DATE_PATTERNS["mdy"].match(text):
-            return datetime.strptime(text, "%m/%d/%Y")
         return datetime.fromisoformat(text)
     except ValueError:
-        return None
+        pass
+    for match, fmt in _DATE_FORMATS:
+        if match(text):
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                return None
+    return None
+
+
+def _date_to_datetime(value: date_cls) -> datetime:
+    return datetime(value.year, value.month, value.day)
+
+
+# Exact-type dispatch for the common cell types; anything else (subclasses,
+# NaT/NA, numpy scalars) takes the isinstance chain below.
+_NAIVE_DISPATCH = {
+    datetime: lambda value: value,
+    date_cls: _date_to_datetime,
+    str: _parse_date_string,
+    int: _parse_excel_number,
+    float: _parse_excel_number,
+}
+if pd is not None:  # pragma: no branch - pandas optional dependency guard
+    _NAIVE_DISPATCH[pd.Timestamp] = lambda value: value.to_pydatetime()  # no pandas types leak out
 
 
 def _coerce_datetime_naive(value: object) -> Optional[datetime]:
     """Best-effort coercion of value into ``datetime`` without timezone handling."""
 
+    handler = _NAIVE_DISPATCH.get(value.__class__)
+    if handler is not None:
+        return handler(value)
+
     if _is_missing_value(value):
         return None
 
@@ -99,7 +124,7 @@ def _coerce_datetime_naive(value: object) -> Optional[datetime]:
         return value.to_pydatetime()
 
     if isinstance(value, date_cls):
-        return datetime(value.year, value.month, value.day)
+        return _date_to_datetime(value)
 
     excel_dt = _parse_excel_number(value)
     if excel_dt:
@@ -138,6 +163,16 @@ def coerce_datetime(
 def date_to_iso(value: object, *, tzinfo: Optional[tzinfo_cls] = None) -> str:
     """Return the ``YYYY-MM-DD`` string for a value if it is date-like."""
 
+    # Fast paths for the common openpyxl cell types. Aware datetimes still go
+    # through coerce_datetime because converting the timezone can shift the day.
+    cls = value.__class__
+    if value is None or (cls is str and not value):  # blank cells skip the parser
+        return ""
+    if cls is datetime and (tzinfo is None or value.tzinfo is None):
+        return value.date().isoformat()
+    if cls is date_cls:
+        return value.isoformat()
+
     dt = coerce_datetime(value, tzinfo=tzinfo)
     if dt is None:
         return ""
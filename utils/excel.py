@@ -1,13 +1,29 @@
 # utils/excel.py
 from __future__ import annotations
 
-from typing import Callable, Dict, Tuple, TYPE_CHECKING
+from dataclasses import astuple
+from datetime import date, datetime, time as dt_time, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+import hashlib
+import json
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
 
 import openpyxl
 import pandas as pd
 
+from config.settings import IMPORT_CACHE_DIR
+
+try:  # Optional Rust-backed reader, used for bulk table reads when installed.
+    from python_calamine import CalamineWorkbook  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    CalamineWorkbook = None  # type: ignore
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 1) Strict normalizer used by the importer wherever needed
 # ─────────────────────────────────────────────────────────────────────────────
@@ -101,10 +117,14 @@ MATRIX = {
 # ─────────────────────────────────────────────────────────────────────────────
 # 3) Tiny helpers your import service can use
 # ─────────────────────────────────────────────────────────────────────────────
+_NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]+")
+
+
+@lru_cache(maxsize=256)
 def _norm_tablename(name: str) -> str:
     """Normalize an Excel table name to a lowercase alphanumeric key."""
 
-    return re.sub(r"[^0-9a-zA-Z]+", "", (name or "")).lower()
+    return _NON_ALNUM_RE.sub("", (name or "")).lower()
 
 
 def list_country_tables() -> list[str]:
@@ -121,37 +141,368 @@ if TYPE_CHECKING:  # pragma: no cover - imported only for typing
     from services.xlsx_tables_inspector import TableRef
 
 
+def _calamine_value(value: Any) -> Any:
+    """Coerce a calamine cell to what openpyxl (data_only) would return."""
+    if value == "":
+        return None
+    cls = value.__class__
+    if cls is float and value.is_integer():
+        return int(value)
+    if cls is date:
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+_DISK_CACHE_VERSION = 2
+# Persisted extractions hold uploaded PII: prune them by age and count.
+_DISK_CACHE_MAX_AGE_SECONDS = 24 * 3600
+_DISK_CACHE_MAX_FILES = 32
+_DISK_CACHE_SUFFIX = ".json"
+
+
+def _encode_cell(value: Any) -> Any:
+    """``json.dump`` default hook: tag the temporal cell types workbooks yield."""
+    cls = value.__class__
+    if cls is datetime:
+        return {"$datetime": value.isoformat()}
+    if cls is date:
+        return {"$date": value.isoformat()}
+    if cls is dt_time:
+        return {"$time": value.isoformat()}
+    if cls is timedelta:
+        return {"$timedelta": [value.days, value.seconds, value.microseconds]}
+    raise TypeError(f"cannot persist {cls.__name__} cell value")
+
+
+_CELL_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+    "$time": dt_time.fromisoformat,
+    "$timedelta": lambda parts: timedelta(*parts),
+}
+
+
+def _decode_cell(obj: Dict[str, Any]) -> Any:
+    """``json.load`` object hook undoing `_encode_cell`."""
+    if len(obj) == 1:
+        ((tag, value),) = obj.items()
+        decoder = _CELL_DECODERS.get(tag)
+        if decoder is not None:
+            return decoder(value)
+    return obj
+
+
+def _dump_extraction(data: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready form of an extraction (tuple keys become list entries)."""
+    tables = data["tables"]
+    return {
+        "version": _DISK_CACHE_VERSION,
+        "tables": None if tables is None else [astuple(t) for t in tables],
+        "values": [[sheet, ref, rows] for (sheet, ref), rows in data["values"].items()],
+        "cells": [[title, coords, values] for (title, coords), values in data["cells"].items()],
+    }
+
+
+def _load_extraction(raw: Any) -> Optional[Dict[str, Any]]:
+    """Inverse of `_dump_extraction`; ``None`` for another version or shape."""
+    if not isinstance(raw, dict) or raw.get("version") != _DISK_CACHE_VERSION:
+        return None
+    from services.xlsx_tables_inspector import TableRef  # local: avoid import cycle
+
+    tables = raw["tables"]
+    return {
+        "version": _DISK_CACHE_VERSION,
+        "tables": None if tables is None else [TableRef(*t) for t in tables],
+        "values": {(sheet, ref): [tuple(r) for r in rows] for sheet, ref, rows in raw["values"]},
+        "cells": {(title, tuple(coords)): tuple(values) for title, coords, values in raw["cells"]},
+    }
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _prune_disk_cache(cache_dir: str) -> None:
+    """
+    Delete persisted extractions older than the max age, then the oldest
+    beyond the max count. Pickles from the former format are always removed.
+    """
+    try:
+        entries = [e for e in os.scandir(cache_dir) if e.is_file()]
+    except OSError:
+        return
+    now = time.time()
+    fresh: List[Tuple[float, str]] = []
+    for entry in entries:
+        if entry.name.endswith(".pkl"):
+            _remove_quietly(entry.path)
+            continue
+        if not entry.name.endswith(_DISK_CACHE_SUFFIX):
+            continue
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        if now - mtime > _DISK_CACHE_MAX_AGE_SECONDS:
+            _remove_quietly(entry.path)
+        else:
+            fresh.append((mtime, entry.path))
+    fresh.sort(reverse=True)
+    for _mtime, path in fresh[_DISK_CACHE_MAX_FILES:]:
+        _remove_quietly(path)
+
+# Hand-off of one extraction from validation (upload request) to the parse
+# that follows it (proceed request). A publishing WorkbookCache stores its
+# extraction here on clear(); the next WorkbookCache opened on the unchanged
+# file takes it out again, and any other cache's clear() drops it, so raw
+# cell values (passport numbers, IBANs, DOBs) are not kept past that flow.
+# Entries nobody takes (abandoned uploads) expire after _SHARED_TTL_SECONDS.
+_SHARED_MAX_ENTRIES = 4
+_SHARED_TTL_SECONDS = 15 * 60
+# abspath → (stat signature, publish time, extraction)
+_shared_extractions: "OrderedDict[str, Tuple[Tuple[int, int, int], float, Dict[str, Any]]]" = OrderedDict()
+_shared_lock = threading.Lock()
+
+
+def _stat_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _expire_shared(now: float) -> None:
+    """Drop hand-offs older than the TTL (caller holds ``_shared_lock``)."""
+    for key in [k for k, (_sig, at, _data) in _shared_extractions.items() if now - at > _SHARED_TTL_SECONDS]:
+        del _shared_extractions[key]
+
+
+def _publish_shared(path: str, signature: Tuple[int, int, int], data: Dict[str, Any]) -> None:
+    now = time.monotonic()
+    with _shared_lock:
+        _expire_shared(now)
+        _shared_extractions.pop(path, None)
+        _shared_extractions[path] = (signature, now, data)
+        while len(_shared_extractions) > _SHARED_MAX_ENTRIES:
+            _shared_extractions.popitem(last=False)
+
+
+def _take_shared(path: str) -> Optional[Dict[str, Any]]:
+    """Remove and return the hand-off for ``path`` if the file is unchanged."""
+    with _shared_lock:
+        _expire_shared(time.monotonic())
+        entry = _shared_extractions.pop(path, None)
+    if entry is None:
+        return None
+    signature, _at, data = entry
+    return data if signature == _stat_signature(path) else None
+
+
+def _drop_shared(path: str) -> None:
+    with _shared_lock:
+        _shared_extractions.pop(path, None)
+
+
 class WorkbookCache:
-    """Cache a workbook and derived table DataFrames for a single XLSX path."""
+    """
+    Cache a workbook and derived table data for a single XLSX path.
+
+    With ``publish=True`` (validation), ``clear()`` hands the extracted table
+    list, raw table values and header cells to the next cache opened on the
+    same unchanged file (the parse), which takes them over; a publishing
+    cache never reuses a previous hand-off, so a re-upload is always read
+    fresh. When ``cache_dir`` (default: ``IMPORT_CACHE_DIR``) is set, the
+    extraction is also persisted there as JSON keyed by the SHA-1 of the
+    file contents, so re-parsing an unchanged upload skips XML parsing
+    entirely even across processes; files are pruned after a day (and beyond
+    32). An empty value disables the disk cache.
+
+    Use it as a context manager (or call ``clear()``) to persist the
+    extraction and release the workbook handles.
+    """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, cache_dir: Optional[str] = None, *, publish: bool = False):
         self.path = path
+        self._shared_key = os.path.abspath(path)
+        self._publish = publish
+        self._signature: Optional[Tuple[int, int, int]] = None
         self._workbook: Workbook | None = None
+        self._calamine: Any = None
+        self._calamine_failed = CalamineWorkbook is None
+        self._sheet_values: Dict[str, List[List[Any]]] = {}
         self._table_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._cache_dir = IMPORT_CACHE_DIR if cache_dir is None else cache_dir
+        self._disk: Optional[Dict[str, Any]] = None
+        self._disk_file: Optional[str] = None
+        self._disk_dirty = False
+
+    def __enter__(self) -> "WorkbookCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.clear()
 
     def get_workbook(self) -> Workbook:
-        """Return (and memoize) the loaded openpyxl workbook for ``path``."""
+        """Return (and memoize) the read-only openpyxl workbook for ``path``."""
         if self._workbook is None:
-            self._workbook = openpyxl.load_workbook(self.path, data_only=True)
+            self._workbook = openpyxl.load_workbook(self.path, data_only=True, read_only=True)
         return self._workbook
 
     def get_sheet(self, title: str) -> Worksheet:
         """Return a worksheet from the cached workbook."""
         return self.get_workbook()[title]
 
+    def get_sheet_values(self, title: str) -> Optional[List[List[Any]]]:
+        """
+        Return all cell values of sheet ``title`` (row 1 / column A first) read
+        with python-calamine, or ``None`` when calamine is unavailable or fails
+        so callers can fall back to openpyxl.
+        """
+        if title in self._sheet_values:
+            return self._sheet_values[title]
+        if self._calamine_failed:
+            return None
+        try:
+            if self._calamine is None:
+                self._calamine = CalamineWorkbook.from_path(self.path)
+            raw = self._calamine.get_sheet_by_name(title).to_python(skip_empty_area=False)
+        except Exception:
+            self._calamine_failed = True
+            return None
+        values = [[_calamine_value(v) for v in row] for row in raw]
+        self._sheet_values[title] = values
+        return values
+
+    def get_tables(self) -> List["TableRef"]:
+        """Return (and memoize) every Excel table defined in the workbook."""
+        disk = self._load_disk()
+        if disk["tables"] is None:
+            from services.xlsx_tables_inspector import list_tables  # local: avoid import cycle
+
+            disk["tables"] = list_tables(self.path)
+            self._disk_dirty = True
+        return disk["tables"]
+
+    def get_table_values(
+        self,
+        table: "TableRef",
+        reader: Callable[[], List[tuple]],
+    ) -> List[tuple]:
+        """Return memoized raw values of ``table``'s range using ``reader`` if needed."""
+        values = self._load_disk()["values"]
+        key = (table.sheet_title, table.ref)
+        if key not in values:
+            values[key] = reader()
+            self._disk_dirty = True
+        return values[key]
+
+    def get_cells(
+        self,
+        title: str,
+        coords: Tuple[str, ...],
+        reader: Callable[[], tuple],
+    ) -> tuple:
+        """Return memoized values of single cells on sheet ``title``."""
+        cells = self._load_disk()["cells"]
+        key = (title, coords)
+        if key not in cells:
+            cells[key] = reader()
+            self._disk_dirty = True
+        return cells[key]
+
     def get_table_df(
         self,
         table: "TableRef",
-        builder: Callable[["Worksheet"], pd.DataFrame],
+        builder: Callable[[], pd.DataFrame],
     ) -> pd.DataFrame:
         """Return a memoized DataFrame for ``table`` using ``builder`` if needed."""
         key = (table.sheet_title, table.ref)
         if key not in self._table_cache:
-            worksheet = self.get_sheet(table.sheet_title)
-            self._table_cache[key] = builder(worksheet)
+            self._table_cache[key] = builder()
         return self._table_cache[key]
 
+    def _load_disk(self) -> Dict[str, Any]:
+        """Load the handed-off or persisted extraction for this file (or start an empty one)."""
+        if self._disk is not None:
+            return self._disk
+
+        if self._publish:
+            self._signature = _stat_signature(self.path)
+        else:
+            shared = _take_shared(self._shared_key)
+            if shared is not None:
+                self._disk = shared
+                return shared
+
+        self._disk = self._read_disk_file()
+        return self._disk
+
+    def _disk_path(self) -> Optional[str]:
+        """Cache file for this workbook's contents (hashed on first use), if enabled."""
+        if self._disk_file is None and self._cache_dir:
+            digest = hashlib.sha1()
+            with open(self.path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    digest.update(chunk)
+            self._disk_file = os.path.join(self._cache_dir, f"{digest.hexdigest()}{_DISK_CACHE_SUFFIX}")
+        return self._disk_file
+
+    def _read_disk_file(self) -> Dict[str, Any]:
+        """The persisted extraction for this file, or a fresh empty one."""
+        empty = {"version": _DISK_CACHE_VERSION, "tables": None, "values": {}, "cells": {}}
+        disk_file = self._disk_path()
+        if not disk_file:
+            return empty
+        try:
+            if time.time() - os.stat(disk_file).st_mtime > _DISK_CACHE_MAX_AGE_SECONDS:
+                _remove_quietly(disk_file)
+                return empty
+            with open(disk_file, "r", encoding="utf-8") as fh:
+                data = _load_extraction(json.load(fh, object_hook=_decode_cell))
+        except Exception:
+            return empty  # missing or unreadable: rebuild
+        return data if data is not None else empty
+
+    def save(self) -> None:
+        """Persist newly extracted data when a disk cache is configured."""
+        if not (self._disk_dirty and self._cache_dir):
+            return
+        tmp = None
+        try:
+            disk_file = self._disk_path()
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp = f"{disk_file}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(_dump_extraction(self._disk), fh, default=_encode_cell)
+            os.replace(tmp, disk_file)
+        except (OSError, TypeError, ValueError):
+            if tmp:
+                _remove_quietly(tmp)
+            return  # the cache is an optimization only
+        self._disk_dirty = False
+        _prune_disk_cache(self._cache_dir)
+
     def clear(self) -> None:
-        """Drop cached workbook + table data (mainly for tests)."""
+        """
+        Persist extracted data, close the workbook and drop cached table data.
+        A publishing cache hands its extraction on; any other drops the hand-off.
+        """
+        self.save()
+        if self._publish and self._disk is not None and self._signature is not None:
+            _publish_shared(self._shared_key, self._signature, self._disk)
+        else:
+            _drop_shared(self._shared_key)
+        if self._workbook is not None:
+            self._workbook.close()  # read-only workbooks keep the zip handle open
         self._workbook = None
+        if self._calamine is not None and hasattr(self._calamine, "close"):
+            self._calamine.close()
+        self._calamine = None
+        self._sheet_values.clear()
         self._table_cache.clear()
+        self._disk = None
+        self._disk_file = None
@@ -11,6 +11,7 @@ Pydantic model before inserting into MongoDB.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 import re
 from typing import Any, Optional, Tuple
 
@@ -86,7 +87,7 @@ def _split_location(value: str) -> Tuple[str, Optional[str]]:
 def _normalize_str(value: Any) -> str:
     if value is None:
         return ""
-    if isinstance(value, float) and pd.isna(value):
+    if isinstance(value, float) and value != value:  # NaN
         return ""
     return str(value).strip()
 
@@ -104,7 +105,7 @@ def _normalize_gender(value: Any) -> Optional[Gender]:
 
 
 def _normalize_grade(value: Any) -> Grade:
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if value is None or (isinstance(value, float) and value != value):  # NaN
         return Grade.NORMAL
     try:
         return Grade(int(value))
@@ -112,15 +113,20 @@ def _normalize_grade(value: Any) -> Grade:
         return Grade.NORMAL
 
 
+@lru_cache(maxsize=None)
+def _enum_index(enum_cls) -> dict:
+    """Lowercased value → member, built once per enum class."""
+    index: dict = {}
+    for member in enum_cls:  # type: ignore[call-arg]
+        index.setdefault(member.value.lower(), member)  # first member wins, as before
+    return index
+
+
 def _match_enum_value(enum_cls, value: Any):
     text = _normalize_str(value)
     if not text:
         return None
-    lowered = text.lower()
-    for member in enum_cls:  # type: ignore[call-arg]
-        if lowered == member.value.lower():
-            return member
-    return None
+    return _enum_index(enum_cls).get(text.lower())
 
 
 def _normalize_transport(value: Any) -> Optional[Transport]:
@@ -213,7 +219,8 @@ def check_and_import_data():
         now = datetime.now(timezone.utc)
         event_lookup: dict[str, pd.Timestamp] = {}
         event_docs: dict[str, dict] = {}
-        for idx, row in df_events.iterrows():
+        # Rows are plain dicts (same row.get() access) rather than one Series per row
+        for idx, row in zip(df_events.index, df_events.to_dict(orient="records")):
             eid = str(row.get("Event", "")).strip()
             if not eid:
                 continue
@@ -273,7 +280,7 @@ def check_and_import_data():
 
         # === Insert Countries with stable CIDs ===
         country_lookup: dict[str, str] = {}
-        for idx, row in df_countries.iterrows():
+        for idx, row in zip(df_countries.index, df_countries.to_dict(orient="records")):
             name_value = row.get("Country", "")
             name = "" if pd.isna(name_value) else str(name_value).strip()
 
@@ -370,7 +377,7 @@ def check_and_import_data():
                 existing[key] = value
             return existing
 
-        for row_index, row in df_participants.iterrows():
+        for row_index, row in zip(df_participants.index, df_participants.to_dict(orient="records")):
             row_number = int(row_index) + 2
             raw_name = _normalize_str(row.get("Name"))
             if not raw_name:
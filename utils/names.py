@@ -3,24 +3,31 @@
 
 from __future__ import annotations
 
-import re
 import unicodedata
-from typing import Iterator, Tuple
-
-_WHITESPACE_RE = re.compile(r"\s+")
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Tuple
 
+try:  # Optional C/SIMD edit-distance backend for fuzzy key matching.
+    from rapidfuzz import process as _rf_process  # type: ignore
+    from rapidfuzz.distance import OSA as _rf_osa  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    _rf_process = None
+    _rf_osa = None
 
 def _normalize_whitespace(value: str | None) -> str:
     """Collapse internal whitespace and trim leading/trailing spaces."""
 
-    return _WHITESPACE_RE.sub(" ", (value or "").strip())
+    return " ".join((value or "").split())
 
 
+@lru_cache(maxsize=4096)
 def _canon(name: str) -> str:
     """Return a lowercase, accent-stripped version of *name*."""
 
     if not name:
         return ""
+    if name.isascii():  # nothing to decompose: skip the NFD pass
+        return name.lower()
     nfd = unicodedata.normalize("NFD", name)
     return "".join(ch for ch in nfd if not unicodedata.combining(ch)).lower()
 
@@ -31,6 +38,13 @@ def _name_key(last: str, first_middle: str) -> str:
     return f"{_canon(last)}|{_canon(first_middle)}".strip()
 
 
+def _name_keys(last: str, *first_middles: str) -> list[str]:
+    """``_name_key(last, fm)`` for each given-name variant; ``last`` is canonicalized once."""
+
+    last_canon = _canon(last)
+    return [f"{last_canon}|{_canon(fm)}".strip() for fm in first_middles]
+
+
 def _split_name_variants(raw: str) -> Iterator[Tuple[str, str, str]]:
     """Yield possible (first, middle, last) tuples for ``raw`` name text."""
 
@@ -40,11 +54,12 @@ def _split_name_variants(raw: str) -> Iterator[Tuple[str, str, str]]:
 
     if "," in s:
         last_part, first_part = [x.strip() for x in s.split(",", 1)]
-        tokens = first_part.split() + last_part.split()
-    else:
-        tokens = s.split()
+        s = f"{first_part} {last_part}"
 
-    tokens = [_canon(t) for t in tokens]
+    # One (memoized) canonicalization for the whole name, not one per token
+    tokens = _canon(s).split()
+    if not tokens:
+        return
 
     if len(tokens) == 1:
         yield tokens[0], "", ""
@@ -60,6 +75,84 @@ def _split_name_variants(raw: str) -> Iterator[Tuple[str, str, str]]:
         yield first, middle, last
 
 
+def _edit_distance_within(a: str, b: str, max_dist: int) -> Optional[int]:
+    """
+    Optimal-string-alignment distance between ``a`` and ``b`` (Levenshtein
+    plus adjacent transpositions, so 'vic' → 'ivc' is one edit) if it is at
+    most ``max_dist``, else ``None``. Keeps three rolling rows and stops as
+    soon as every cell of the current row exceeds ``max_dist``.
+    """
+
+    if abs(len(a) - len(b)) > max_dist:
+        return None
+    if len(a) < len(b):
+        a, b = b, a
+    before: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cost = current[j - 1] + 1
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if previous[j - 1] + (ca != cb) < cost:
+                cost = previous[j - 1] + (ca != cb)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb and before[j - 2] + 1 < cost:
+                cost = before[j - 2] + 1
+            current[j] = cost
+        if min(current) > max_dist:
+            return None
+        before, previous = previous, current
+    return previous[-1] if previous[-1] <= max_dist else None
+
+
+# Short keys leave little room for typos before they spell another person's
+# name ('ilic|ana' vs 'ivic|ina'), so they only tolerate a single edit.
+_FUZZY_SHORT_KEY_LEN = 12
+
+
+def _fuzzy_max_dist(key: str) -> int:
+    """Edit budget for fuzzy-matching ``key``: 1 below 12 characters, else 2."""
+
+    return 1 if len(key) < _FUZZY_SHORT_KEY_LEN else 2
+
+
+def _fuzzy_key_match(
+    target: str, candidates: Iterable[str], max_dist: Optional[int] = None
+) -> Optional[str]:
+    """
+    Return the candidate lookup key closest to ``target`` within ``max_dist``
+    edits (default: `_fuzzy_max_dist` of ``target``), counting a swap of
+    adjacent letters as one. Returns ``None`` when nothing is close enough or
+    when two or more candidates tie at the best distance (ambiguous).
+    """
+
+    if not target:
+        return None
+    if max_dist is None:
+        max_dist = _fuzzy_max_dist(target)
+    if _rf_process is not None:
+        hits = _rf_process.extract(
+            target, candidates, scorer=_rf_osa.distance, score_cutoff=max_dist, limit=2
+        )
+        if not hits or (len(hits) > 1 and hits[1][1] == hits[0][1]):
+            return None
+        return hits[0][0]
+
+    best: Optional[str] = None
+    best_dist = max_dist + 1
+    tied = False
+    for candidate in candidates:
+        dist = _edit_distance_within(target, candidate, min(best_dist, max_dist))
+        if dist is None:
+            continue
+        if dist < best_dist:
+            best, best_dist, tied = candidate, dist, False
+        elif dist == best_dist:
+            tied = True
+    return None if tied else best
+
+
 def _name_key_from_raw(raw_display: str) -> str:
     """Normalize 'Last, First' or 'First Last' → canonical ``last|first`` key."""
 
@@ -96,6 +189,7 @@ def normalize_name(full_name: str) -> str:
     return f"{' '.join(parts[:-1])} {parts[-1].upper()}"
 
 
+@lru_cache(maxsize=1024)
 def _to_app_display_name(fullname: str) -> str:
     """Convert ``'First Middle Last'`` to ``'First Middle LAST'`` display form."""
 
@@ -109,6 +203,7 @@ def _to_app_display_name(fullname: str) -> str:
 __all__ = [
     "_canon",
     "_name_key",
+    "_name_keys",
     "_split_name_variants",
     "_name_key_from_raw",
     "normalize_name",
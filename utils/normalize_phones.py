@@ -14,6 +14,7 @@ a simple digit-only heuristic otherwise.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 try:  # pragma: no cover - optional dependency
@@ -34,6 +35,17 @@ def normalize_phone(value: object) -> Optional[str]:
     text = str(value).strip()
     if not text:
         return None
+    return _normalize_phone_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_phone_text(text: str) -> Optional[str]:
+    """Memoized core of :func:`normalize_phone` for non-empty stripped text.
+
+    An import normalizes the same numbers several times per attendee
+    (ParticipantsLista, MAIN ONLINE, final record), and phonenumbers parsing
+    dominates that cost.
+    """
 
     if phonenumbers is not None:  # pragma: no branch - best-effort parsing
         try:
@@ -24,6 +24,10 @@ if TYPE_CHECKING:  # pragma: no cover - circular import avoidance
     from domain.models.participant import Gender
 
 
+_GLOBAL_PARTICIPANT_CACHE = None
+_GLOBAL_PARTICIPANT_REPO = None
+
+
 class ParticipantLookupCache:
     """Shared cache for participant lookups keyed by country and name."""
 
@@ -41,6 +45,37 @@ class ParticipantLookupCache:
 
         self.clear()
 
+    @staticmethod
+    def _index_by_name(participants: list[Participant]) -> dict[str, list[Participant]]:
+        lookup: dict[str, list[Participant]] = {}
+        for p in participants:
+            name = p.name or ""
+            lookup.setdefault(name, []).append(p)
+        return lookup
+
+    def preload(self, representing_countries) -> None:
+        """Load every not-yet-cached country in a single repository query."""
+
+        missing = [cid for cid in dict.fromkeys(representing_countries) if cid and cid not in self._cache]
+        if not missing:
+            return
+
+        if DEBUG_PRINT:
+            print(f"[CACHE] Preloading participants for countries={missing}")
+
+        try:
+            participants = self._repo.find_by_countries(missing)
+        except Exception as exc:
+            if DEBUG_PRINT:
+                print(f"[CACHE][ERROR] find_by_countries failed: {exc}")
+            return  # fall back to per-country loading on demand
+
+        grouped: dict[str, list[Participant]] = {cid: [] for cid in missing}
+        for p in participants:
+            grouped.setdefault(p.representing_country, []).append(p)
+        for cid in missing:
+            self._cache[cid] = self._index_by_name(grouped[cid])
+
     def _load_for_country(self, representing_country: str) -> None:
         if representing_country in self._cache:
             if DEBUG_PRINT:
@@ -59,12 +94,7 @@ class ParticipantLookupCache:
             self._cache[representing_country] = {}
             return
 
-        lookup: dict[str, list[Participant]] = {}
-
-        for p in participants:
-            name = p.name or ""
-            lookup.setdefault(name, []).append(p)
-
+        lookup = self._index_by_name(participants)
         self._cache[representing_country] = lookup
 
         if DEBUG_PRINT:
@@ -179,6 +209,19 @@ def lookup(
     )
 
 
+def preload(representing_countries) -> None:
+    """Warm the shared cache for several countries with one DB round-trip."""
+
+    if _GLOBAL_PARTICIPANT_CACHE is None:
+        if _GLOBAL_PARTICIPANT_REPO is None:
+            return
+        initialize_cache(_GLOBAL_PARTICIPANT_REPO)
+        if _GLOBAL_PARTICIPANT_CACHE is None:
+            return
+
+    _GLOBAL_PARTICIPANT_CACHE.preload(representing_countries)
+
+
 def refresh() -> None:
     """Clear cached participant lookups to reflect latest DB state."""
 
@@ -194,7 +237,7 @@ def _normalize_gender(value):
         return value
     if value is None:
         return None
-    if isinstance(value, float) and pd.isna(value):
+    if isinstance(value, float) and value != value:  # NaN
         return None
 
     text = str(value).strip()
@@ -4,13 +4,57 @@ Serialization helpers for converting Pydantic models to Mongo-friendly dictionar
 These helpers are intentionally unaware of Excel/tables/parsing logic.
 """
 from datetime import datetime
-from typing import Any, Dict, Optional
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from domain.models.event import Event
 from domain.models.event_participant import EventParticipant
 from domain.models.participant import Participant
 
 
+def _enum_value(val: Any) -> Any:
+    # isinstance is a plain type check; hasattr on a str raises internally
+    return val.value if isinstance(val, Enum) else val
+
+
+def _int_or_default(val: Any) -> Any:
+    if isinstance(val, datetime):
+        return val  # keep native datetime (already EU tz)
+    try:
+        return int(val)
+    except Exception:
+        return 1
+
+
+def _dump_flat_model(obj, fields) -> Dict[str, Any]:
+    """
+    `model_dump(exclude_none=True)` for our flat Pydantic models: read the
+    attributes directly instead of running the serializer. Lists (and the
+    dicts inside them, e.g. audit entries) are copied so the preview never
+    aliases the model's own containers.
+    """
+    out: Dict[str, Any] = {}
+    for name in fields:
+        val = getattr(obj, name)
+        if val is None:
+            continue
+        if val.__class__ is list:
+            val = [dict(item) if item.__class__ is dict else item for item in val]
+        out[name] = val
+    return out
+
+
+@lru_cache(maxsize=None)
+def _field_converters(
+    enum_fields: Tuple[str, ...], ensure_int_fields: Tuple[str, ...]
+) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    """(field, converter) pairs for one serializer configuration, built once."""
+    converters: Dict[str, Callable[[Any], Any]] = {k: _int_or_default for k in ensure_int_fields}
+    converters.update((k, _enum_value) for k in enum_fields)
+    return tuple(converters.items())
+
+
 def serialize_model_for_preview(
     obj, enum_fields: tuple = (), ensure_int_fields: tuple = ()
 ):
@@ -23,22 +67,15 @@ def serialize_model_for_preview(
     if obj is None:
         return {}
 
-    data = obj.model_dump(exclude_none=True)
-    out: Dict[str, Any] = {}
-
-    for key, val in data.items():
-        if key in enum_fields and hasattr(val, "value"):
-            out[key] = val.value
-        elif isinstance(val, datetime):
-            # keep native datetime (already EU tz)
-            out[key] = val
-        elif key in ensure_int_fields:
-            try:
-                out[key] = int(val)
-            except Exception:
-                out[key] = 1
-        else:
-            out[key] = val
+    fields = getattr(type(obj), "model_fields", None)
+    if fields is None:  # plain dataclasses (Event) provide their own model_dump
+        out: Dict[str, Any] = obj.model_dump(exclude_none=True)
+    else:
+        out = _dump_flat_model(obj, fields)
+    # `out` is a fresh dict: convert only the configured fields in place
+    for key, convert in _field_converters(enum_fields, ensure_int_fields):
+        if key in out:
+            out[key] = convert(out[key])
     return out
 
 
@@ -69,21 +106,11 @@ def merge_attendee_preview(participant: Participant, ep: EventParticipant) -> Di
     Combine Participant and EventParticipant data into a single attendee preview record.
     Keeps all datetime objects (Mongo-ready) and converts Enums to .value strings.
     """
-    transportation = (
-        ep.transportation.value if hasattr(ep.transportation, "value") else ep.transportation
-    )
-    travel_doc_type = (
-        ep.travel_doc_type.value if hasattr(ep.travel_doc_type, "value") else ep.travel_doc_type
-    )
-    iban_type = (
-        ep.iban_type.value if hasattr(ep.iban_type, "value") else ep.iban_type
-    )
-
-    attendee: Dict[str, Any] = {
+    return {
         "pid": participant.pid,
         "name": participant.name,
         "representing_country": participant.representing_country,
-        "gender": participant.gender.value if hasattr(participant.gender, "value") else participant.gender,
+        "gender": _enum_value(participant.gender),
         "grade": int(participant.grade),
         "dob": participant.dob,  # keep datetime
         "pob": participant.pob,
@@ -100,18 +127,16 @@ def merge_attendee_preview(participant: Participant, ep: EventParticipant) -> Di
         "bio_short": participant.bio_short,
         "event_id": ep.event_id,
         "participant_id": ep.participant_id,
-        "transportation": transportation,
+        "transportation": _enum_value(ep.transportation),
         "transport_other": ep.transport_other,
         "traveling_from": ep.traveling_from,
         "returning_to": ep.returning_to,
-        "travel_doc_type": travel_doc_type,
+        "travel_doc_type": _enum_value(ep.travel_doc_type),
         "travel_doc_issue_date": ep.travel_doc_issue_date,  # keep datetime
         "travel_doc_expiry_date": ep.travel_doc_expiry_date,  # keep datetime
         "travel_doc_issued_by": ep.travel_doc_issued_by,
         "bank_name": ep.bank_name,
         "iban": ep.iban,
-        "iban_type": iban_type,
+        "iban_type": _enum_value(ep.iban_type),
         "swift": ep.swift,
     }
-
-    return attendee